@@ -6,7 +6,7 @@ and their NMR-relevant properties.
 """
 
 import re
-from typing import List, Dict, Optional, Tuple
+from typing import Iterable, List, Dict, Optional, Tuple
 from dataclasses import dataclass
 
 
@@ -77,6 +77,10 @@ class Molecule:
         """Add an atom to the molecule."""
         self.atoms.append(atom)
     
+    def add_atoms(self, atoms: Iterable[Atom]) -> None:
+        """Add several atoms to the molecule in one call."""
+        self.atoms.extend(atoms)
+    
     def get_atoms_by_element(self, element: str) -> List[Atom]:
         """Get all atoms of a specific element."""
         return [atom for atom in self.atoms if atom.element == element]
@@ -6,7 +6,7 @@ This module provides classes for representing and manipulating NMR spectra data.
 
 import numpy as np
 import matplotlib.pyplot as plt
-from typing import List, Tuple, Optional, Dict
+from typing import Iterable, List, Tuple, Optional, Dict
 from dataclasses import dataclass, field
 
 
@@ -63,6 +63,10 @@ class Spectrum:
         """Add a peak to the spectrum."""
         self.peaks.append(peak)
     
+    def add_peaks(self, peaks: Iterable[Peak]) -> None:
+        """Add several peaks to the spectrum in one call."""
+        self.peaks.extend(peaks)
+    
     def add_peak_simple(self, chemical_shift: float, intensity: float = 1.0, 
                        width: float = 0.01, multiplicity: str = 's') -> None:
         """
@@ -266,6 +270,18 @@ class Spectrum:
             peak_list.append(peak_dict)
         return peak_list
     
+    def as_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the peak table as parallel arrays.
+        
+        Returns:
+            Tuple of (chemical shifts, intensities) as float64 arrays, in peak order
+        """
+        n_peaks = len(self.peaks)
+        shifts = np.fromiter((peak.chemical_shift for peak in self.peaks), dtype=np.float64, count=n_peaks)
+        intensities = np.fromiter((peak.intensity for peak in self.peaks), dtype=np.float64, count=n_peaks)
+        return shifts, intensities
+    
     def export_data(self, filename: str, format: str = 'csv') -> None:
         """
         Export spectrum data to file.
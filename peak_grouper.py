@@ -6,10 +6,97 @@ This module provides intelligent peak grouping to convert individual multiplet l
 into proper NMR multiplets with correct multiplicity and J-coupling information.
 """
 
+import io
 import numpy as np
+from functools import lru_cache
+from operator import itemgetter
 from typing import List, Dict, Tuple, Optional
 import re
 
+# Shared immutable "no coupling" value, so singlets and unresolved multiplets don't allocate a list each
+_EMPTY_COUPLING: Tuple[float, ...] = ()
+
+# Upper bounds (exclusive) of estimated proton counts and the integration label for each bin
+_INTEGRATION_THRESHOLDS = np.array([1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 8.0, 10.0])
+_INTEGRATION_LABELS = ("1H", "2H", "3H", "4H", "5H", "6H", "7H", "9H")
+
+# Optional JIT for the per-group numeric kernels
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True)
+    def _multiplet_stats(shifts, intensities):
+        """Return (min shift, max shift, mean shift, total intensity) in one pass."""
+        smin = shifts[0]
+        smax = shifts[0]
+        ssum = 0.0
+        itotal = 0.0
+        for k in range(shifts.shape[0]):
+            s = shifts[k]
+            if s < smin:
+                smin = s
+            if s > smax:
+                smax = s
+            ssum += s
+            itotal += intensities[k]
+        return smin, smax, ssum / shifts.shape[0], itotal
+else:
+    def _multiplet_stats(shifts, intensities):
+        """Return (min shift, max shift, mean shift, total intensity)."""
+        return float(shifts.min()), float(shifts.max()), float(shifts.mean()), float(intensities.sum())
+
+def _quantize_intensities(intensities: List[float]) -> Tuple[int, ...]:
+    """Normalize intensities to the largest line and round to 2 decimals (as integer percent)."""
+    max_int = max(intensities)
+    return tuple(round(i / max_int * 100) for i in intensities)
+
+# Pattern checks are pure functions of the normalized intensities, so they are
+# memoized on the quantized tuple; the preview dialog re-runs them on every refresh.
+
+@lru_cache(maxsize=2048)
+def _is_triplet_pattern_cached(key: Tuple[int, ...]) -> bool:
+    norm_int = [k / 100 for k in key]
+    
+    # Check for 1:2:1 pattern (with some tolerance)
+    return (abs(norm_int[1] - 1.0) < 0.3 and  # Middle peak should be highest
+            abs(norm_int[0] - norm_int[2]) < 0.3 and  # Outer peaks similar
+            norm_int[0] < 0.8 and norm_int[2] < 0.8)  # Outer peaks smaller
+
+@lru_cache(maxsize=2048)
+def _is_quartet_pattern_cached(key: Tuple[int, ...]) -> bool:
+    # Sort to check pattern
+    sorted_int = sorted(k / 100 for k in key)
+    
+    # For a true quartet: outer peaks ~25% of max, inner peaks ~75-100% of max
+    # Very strict criteria since most 4-peak patterns in aromatic regions are dd
+    return (sorted_int[0] < 0.4 and sorted_int[1] < 0.4 and  # Two small peaks
+            sorted_int[2] > 0.7 and sorted_int[3] > 0.7 and  # Two large peaks
+            abs(sorted_int[0] - sorted_int[1]) < 0.2 and     # Small peaks similar
+            abs(sorted_int[2] - sorted_int[3]) < 0.2)        # Large peaks similar
+
+@lru_cache(maxsize=2048)
+def _is_quintet_pattern_cached(key: Tuple[int, ...]) -> bool:
+    norm_int = [k / 100 for k in key]
+    
+    # Check for quintet pattern - middle peak highest, symmetric
+    return (norm_int[2] > 0.8 and  # Middle peak highest
+            abs(norm_int[0] - norm_int[4]) < 0.3 and  # Outer peaks similar
+            abs(norm_int[1] - norm_int[3]) < 0.3)     # Inner peaks similar
+
+@lru_cache(maxsize=2048)
+def _is_sextet_pattern_cached(key: Tuple[int, ...]) -> bool:
+    norm_int = [k / 100 for k in key]
+    
+    # Check for sextet pattern - two middle peaks highest, symmetric
+    return (max(norm_int[2], norm_int[3]) > 0.8 and  # Middle peaks highest
+            abs(norm_int[0] - norm_int[5]) < 0.3 and  # Outer peaks similar
+            abs(norm_int[1] - norm_int[4]) < 0.3 and  # Second peaks similar
+            abs(norm_int[2] - norm_int[3]) < 0.3)     # Center peaks similar
+
 class PeakGrouper:
     """Intelligent peak grouping for NMR multiplets."""
     
@@ -17,6 +104,7 @@ class PeakGrouper:
         """Initialize the peak grouper."""
         self.coupling_tolerance = 0.1  # Hz tolerance for identifying coupling patterns
         self.grouping_window = 0.5     # ppm window for grouping peaks
+        self.spectrometer_mhz = 400.0  # Spectrometer frequency for ppm -> Hz conversion
         
     def analyze_peaks(self, peaks: List[Dict], assignment_data: Optional[List[Dict]] = None, 
                      aromatic_window=0.05, aliphatic_window=0.1) -> List[Dict]:
@@ -35,8 +123,12 @@ class PeakGrouper:
         if not peaks:
             return peaks
             
+        # Peaks without a shift default to 0 ppm; fill them in so the sort key can be a C-level itemgetter
+        if not all('shift' in p for p in peaks):
+            peaks = [p if 'shift' in p else {**p, 'shift': 0} for p in peaks]
+        
         # Sort peaks by chemical shift
-        sorted_peaks = sorted(peaks, key=lambda p: p.get('shift', 0), reverse=True)
+        sorted_peaks = sorted(peaks, key=itemgetter('shift'), reverse=True)
         
         # Calculate total intensity for relative integration scaling
         total_intensity = sum(p.get('intensity', 100) for p in sorted_peaks)
@@ -45,19 +137,14 @@ class PeakGrouper:
         groups = self._group_nearby_peaks(sorted_peaks, aromatic_window, aliphatic_window)
         
         # Analyze each group for multiplicity
-        analyzed_groups = []
-        for group in groups:
-            analyzed_group = self._analyze_group_multiplicity(group)
-            
-            # Calculate relative integration based on total spectrum intensity
-            analyzed_group['integration'] = self._calculate_relative_integration(
-                analyzed_group, total_intensity)
-            
-            # Try to match with assignment data if available
-            if assignment_data:
-                analyzed_group = self._match_with_assignments(analyzed_group, assignment_data)
-            
-            analyzed_groups.append(analyzed_group)
+        analyzed_groups = [self._analyze_group_multiplicity(group) for group in groups]
+        
+        # Calculate relative integration based on total spectrum intensity
+        self._assign_relative_integrations(analyzed_groups, total_intensity)
+        
+        # Try to match with assignment data if available
+        if assignment_data:
+            self._match_with_assignments(analyzed_groups, assignment_data)
         
         return analyzed_groups
     
@@ -66,53 +153,38 @@ class PeakGrouper:
         if not peaks:
             return []
         
-        groups = []
-        current_group = [peaks[0]]
+        shifts = np.fromiter((p.get('shift', 0) for p in peaks), dtype=np.float64, count=len(peaks))
         
-        for i in range(1, len(peaks)):
-            current_peak = peaks[i]
-            last_peak = current_group[-1]
-            
-            # Calculate distance in ppm
-            distance = abs(current_peak.get('shift', 0) - last_peak.get('shift', 0))
-            
-            # Use configurable grouping windows
-            shift = current_peak.get('shift', 0)
-            if shift > 7.0:  # Aromatic region
-                window = aromatic_window
-            elif shift > 3.0:  # Mid-range
-                window = (aromatic_window + aliphatic_window) / 2
-            else:  # Aliphatic
-                window = aliphatic_window
-            
-            if distance <= window:
-                current_group.append(current_peak)
-            else:
-                # Start new group
-                groups.append(current_group)
-                current_group = [current_peak]
+        # Use configurable grouping windows: aromatic, mid-range, aliphatic
+        windows = np.select([shifts > 7.0, shifts > 3.0],
+                            [aromatic_window, (aromatic_window + aliphatic_window) / 2],
+                            default=aliphatic_window)
         
-        # Add the last group
-        groups.append(current_group)
+        # Start a new group wherever the gap to the previous peak exceeds the current peak's window
+        breaks = np.flatnonzero(np.abs(np.diff(shifts)) > windows[1:]) + 1
+        bounds = [0, *breaks.tolist(), len(peaks)]
         
-        return groups
+        return [peaks[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
     
     def _analyze_group_multiplicity(self, group: List[Dict]) -> Dict:
         """Analyze a group of peaks to determine multiplicity and coupling."""
         if len(group) == 1:
-            # Single peak - likely a singlet
-            peak = group[0].copy()
-            peak['multiplicity'] = 's'
-            peak['coupling'] = []
-            peak['integration'] = self._estimate_integration(group)
-            return peak
+            # Single peak - likely a singlet; build the result directly rather than copying the input dict
+            p0 = group[0]
+            return {
+                'shift': p0.get('shift', 0),
+                'intensity': p0.get('intensity', 100),
+                'multiplicity': 's',
+                'coupling': _EMPTY_COUPLING
+            }
         
         # Multiple peaks - analyze splitting pattern
-        shifts = [p.get('shift', 0) for p in group]
+        shifts = np.fromiter((p.get('shift', 0) for p in group), dtype=np.float64, count=len(group))
         intensities = [p.get('intensity', 100) for p in group]
+        stats = self._group_stats(shifts, np.asarray(intensities, dtype=np.float64))
         
         # Calculate center of multiplet - use geometric mean to preserve original position
-        center_shift = (max(shifts) + min(shifts)) / 2  # Geometric center
+        center_shift = (stats['smax'] + stats['smin']) / 2  # Geometric center
         # weighted_center = sum(s * i for s, i in zip(shifts, intensities)) / sum(intensities)  # Intensity-weighted
         
         # Analyze splitting pattern
@@ -123,135 +195,113 @@ class PeakGrouper:
             'shift': center_shift,  # Use geometric center to preserve position
             'multiplicity': multiplicity,
             'coupling': coupling_constants,
-            'integration': self._estimate_integration(group),
-            'intensity': sum(intensities),  # Total intensity
-            'linewidth': self._estimate_linewidth(group),
+            'intensity': stats['itotal'],  # Total intensity
+            'linewidth': self._estimate_linewidth(stats['smean']),
             'original_peaks': len(group)  # Track how many peaks were grouped
         }
         
         return grouped_peak
     
-    def _determine_multiplicity(self, shifts: List[float], intensities: List[float]) -> Tuple[str, List[float]]:
+    def _group_stats(self, shifts: np.ndarray, intensities: np.ndarray) -> Dict[str, float]:
+        """Compute shift range, mean shift and total intensity of a group in a single pass."""
+        smin, smax, smean, itotal = _multiplet_stats(shifts, intensities)
+        return {'smin': smin, 'smax': smax, 'smean': smean, 'itotal': itotal}
+    
+    def _determine_multiplicity(self, shifts: np.ndarray, intensities: List[float]) -> Tuple[str, List[float]]:
         """Determine multiplicity and coupling constants from peak pattern."""
-        n_peaks = len(shifts)
-        
-        if n_peaks == 1:
-            return 's', []
-        elif n_peaks == 2:
-            # Doublet
-            j_value = abs(shifts[0] - shifts[1]) * 400  # Convert to Hz
-            return 'd', [j_value]
-        elif n_peaks == 3:
-            # Could be triplet or doublet of doublets
-            if self._is_triplet_pattern(intensities):
-                # Calculate J from outer peaks
-                j_value = abs(shifts[0] - shifts[2]) * 400 / 2  # Divide by 2 for triplet
-                return 't', [j_value]
-            else:
-                # Doublet of doublets
-                j_values = self._analyze_dd_pattern(shifts)
-                return 'dd', j_values
-        elif n_peaks == 4:
-            # Could be quartet OR doublet of doublets
-            if self._is_quartet_pattern(intensities):
-                j_value = abs(shifts[0] - shifts[3]) * 400 / 3  # Divide by 3 for quartet
-                return 'q', [j_value]
-            else:
-                # More likely doublet of doublets for 4 peaks with uneven intensity
-                j_values = self._analyze_dd_pattern(shifts)
-                return 'dd', j_values
-        elif n_peaks == 5:
-            # Could be quintet or doublet of triplets
-            if self._is_quintet_pattern(intensities):
-                j_value = abs(shifts[0] - shifts[4]) * 400 / 4
-                return 'quin', [j_value]
-            else:
-                # Doublet of triplets
-                j_values = self._analyze_complex_pattern(shifts, intensities)
-                return 'dt', j_values
-        elif n_peaks == 6:
-            # Could be doublet of triplets, triplet of doublets, or sextet
-            if self._is_sextet_pattern(intensities):
-                j_value = abs(shifts[0] - shifts[5]) * 400 / 5
-                return 'sext', [j_value]
-            else:
-                # Complex multiplet - try to identify pattern
-                j_values = self._analyze_complex_pattern(shifts, intensities)
-                pattern = self._identify_complex_pattern(n_peaks, intensities)
-                return pattern, j_values
-        elif n_peaks == 7:
-            # Likely doublet of triplets (2x3=6 but sometimes 7 due to overlap)
-            j_values = self._analyze_complex_pattern(shifts, intensities)
-            return 'dt', j_values
-        elif n_peaks == 8:
-            # Could be doublet of quartets
-            j_values = self._analyze_complex_pattern(shifts, intensities)
-            return 'dq', j_values
-        else:
-            # Complex multiplet
-            return 'm', []
+        handler = self._MULTIPLICITY_HANDLERS.get(len(shifts), PeakGrouper._multiplicity_complex)
+        return handler(self, shifts, intensities)
+    
+    # Per-line-count handlers for _determine_multiplicity, dispatched through _MULTIPLICITY_HANDLERS
+    
+    def _multiplicity_1(self, shifts: np.ndarray, intensities: List[float]) -> Tuple[str, List[float]]:
+        return 's', _EMPTY_COUPLING
+    
+    def _multiplicity_2(self, shifts: np.ndarray, intensities: List[float]) -> Tuple[str, List[float]]:
+        # Doublet
+        j_value = float(abs(shifts[0] - shifts[1])) * self.spectrometer_mhz  # Convert to Hz
+        return 'd', [j_value]
+    
+    def _multiplicity_3(self, shifts: np.ndarray, intensities: List[float]) -> Tuple[str, List[float]]:
+        # Could be triplet or doublet of doublets
+        if self._is_triplet_pattern(intensities):
+            # Calculate J from outer peaks
+            j_value = float(abs(shifts[0] - shifts[2])) * self.spectrometer_mhz / 2  # Divide by 2 for triplet
+            return 't', [j_value]
+        # Doublet of doublets
+        return 'dd', self._analyze_dd_pattern(shifts)
+    
+    def _multiplicity_4(self, shifts: np.ndarray, intensities: List[float]) -> Tuple[str, List[float]]:
+        # Could be quartet OR doublet of doublets
+        if self._is_quartet_pattern(intensities):
+            j_value = float(abs(shifts[0] - shifts[3])) * self.spectrometer_mhz / 3  # Divide by 3 for quartet
+            return 'q', [j_value]
+        # More likely doublet of doublets for 4 peaks with uneven intensity
+        return 'dd', self._analyze_dd_pattern(shifts)
+    
+    def _multiplicity_5(self, shifts: np.ndarray, intensities: List[float]) -> Tuple[str, List[float]]:
+        # Could be quintet or doublet of triplets
+        if self._is_quintet_pattern(intensities):
+            j_value = float(abs(shifts[0] - shifts[4])) * self.spectrometer_mhz / 4
+            return 'quin', [j_value]
+        # Doublet of triplets
+        return 'dt', self._analyze_complex_pattern(shifts, intensities)
+    
+    def _multiplicity_6(self, shifts: np.ndarray, intensities: List[float]) -> Tuple[str, List[float]]:
+        # Could be doublet of triplets, triplet of doublets, or sextet
+        if self._is_sextet_pattern(intensities):
+            j_value = float(abs(shifts[0] - shifts[5])) * self.spectrometer_mhz / 5
+            return 'sext', [j_value]
+        # Complex multiplet - try to identify pattern
+        j_values = self._analyze_complex_pattern(shifts, intensities)
+        return self._identify_complex_pattern(len(shifts), intensities), j_values
+    
+    def _multiplicity_7(self, shifts: np.ndarray, intensities: List[float]) -> Tuple[str, List[float]]:
+        # Likely doublet of triplets (2x3=6 but sometimes 7 due to overlap)
+        return 'dt', self._analyze_complex_pattern(shifts, intensities)
+    
+    def _multiplicity_8(self, shifts: np.ndarray, intensities: List[float]) -> Tuple[str, List[float]]:
+        # Could be doublet of quartets
+        return 'dq', self._analyze_complex_pattern(shifts, intensities)
+    
+    def _multiplicity_complex(self, shifts: np.ndarray, intensities: List[float]) -> Tuple[str, List[float]]:
+        # Complex multiplet
+        return 'm', _EMPTY_COUPLING
+    
+    _MULTIPLICITY_HANDLERS = {
+        1: _multiplicity_1,
+        2: _multiplicity_2,
+        3: _multiplicity_3,
+        4: _multiplicity_4,
+        5: _multiplicity_5,
+        6: _multiplicity_6,
+        7: _multiplicity_7,
+        8: _multiplicity_8,
+    }
     
     def _is_triplet_pattern(self, intensities: List[float]) -> bool:
         """Check if intensity pattern matches a triplet (1:2:1)."""
         if len(intensities) != 3:
             return False
-        
-        # Normalize intensities
-        max_int = max(intensities)
-        norm_int = [i / max_int for i in intensities]
-        
-        # Check for 1:2:1 pattern (with some tolerance)
-        return (abs(norm_int[1] - 1.0) < 0.3 and  # Middle peak should be highest
-                abs(norm_int[0] - norm_int[2]) < 0.3 and  # Outer peaks similar
-                norm_int[0] < 0.8 and norm_int[2] < 0.8)  # Outer peaks smaller
+        return _is_triplet_pattern_cached(_quantize_intensities(intensities))
     
     def _is_quartet_pattern(self, intensities: List[float]) -> bool:
         """Check if intensity pattern matches a quartet (1:3:3:1)."""
         if len(intensities) != 4:
             return False
-        
-        # Normalize intensities
-        max_int = max(intensities)
-        norm_int = [i / max_int for i in intensities]
-        
-        # Sort to check pattern
-        sorted_int = sorted(norm_int)
-        
-        # For a true quartet: outer peaks ~25% of max, inner peaks ~75-100% of max
-        # Very strict criteria since most 4-peak patterns in aromatic regions are dd
-        return (sorted_int[0] < 0.4 and sorted_int[1] < 0.4 and  # Two small peaks
-                sorted_int[2] > 0.7 and sorted_int[3] > 0.7 and  # Two large peaks
-                abs(sorted_int[0] - sorted_int[1]) < 0.2 and     # Small peaks similar
-                abs(sorted_int[2] - sorted_int[3]) < 0.2)        # Large peaks similar
+        return _is_quartet_pattern_cached(_quantize_intensities(intensities))
     
     def _is_quintet_pattern(self, intensities: List[float]) -> bool:
         """Check if intensity pattern matches a quintet (1:4:6:4:1)."""
         if len(intensities) != 5:
             return False
-        
-        # Normalize intensities
-        max_int = max(intensities)
-        norm_int = [i / max_int for i in intensities]
-        
-        # Check for quintet pattern - middle peak highest, symmetric
-        return (norm_int[2] > 0.8 and  # Middle peak highest
-                abs(norm_int[0] - norm_int[4]) < 0.3 and  # Outer peaks similar
-                abs(norm_int[1] - norm_int[3]) < 0.3)     # Inner peaks similar
+        return _is_quintet_pattern_cached(_quantize_intensities(intensities))
     
     def _is_sextet_pattern(self, intensities: List[float]) -> bool:
         """Check if intensity pattern matches a sextet (1:5:10:10:5:1)."""
         if len(intensities) != 6:
             return False
-        
-        # Normalize intensities
-        max_int = max(intensities)
-        norm_int = [i / max_int for i in intensities]
-        
-        # Check for sextet pattern - two middle peaks highest, symmetric
-        return (max(norm_int[2], norm_int[3]) > 0.8 and  # Middle peaks highest
-                abs(norm_int[0] - norm_int[5]) < 0.3 and  # Outer peaks similar
-                abs(norm_int[1] - norm_int[4]) < 0.3 and  # Second peaks similar
-                abs(norm_int[2] - norm_int[3]) < 0.3)     # Center peaks similar
+        return _is_sextet_pattern_cached(_quantize_intensities(intensities))
     
     def _identify_complex_pattern(self, n_peaks: int, intensities: List[float]) -> str:
         """Identify complex multiplicity patterns."""
@@ -268,27 +318,19 @@ class PeakGrouper:
     def _analyze_complex_pattern(self, shifts: List[float], intensities: List[float]) -> List[float]:
         """Analyze complex coupling patterns for dt, dq, etc."""
         if len(shifts) < 3:
-            return []
-        
-        # Convert to Hz
-        shifts_hz = [s * 400 for s in shifts]
+            return _EMPTY_COUPLING
         
-        # Look for repeating separations that indicate coupling constants
-        separations = []
-        for i in range(len(shifts_hz)-1):
-            separations.append(abs(shifts_hz[i+1] - shifts_hz[i]))
+        # Convert to Hz and take adjacent separations
+        shifts_hz = np.asarray(shifts, dtype=float) * self.spectrometer_mhz
+        separations = np.abs(np.diff(shifts_hz))
         
-        # Group similar separations
-        unique_separations = []
+        # Group similar separations: each one is compared with the first-seen value of every
+        # existing group (not with its neighbour, so groups never chain) and starts a new
+        # group only if none is within the tolerance; groups report their first-seen value
         tolerance = 2.0  # Hz tolerance
-        
-        for sep in separations:
-            found_group = False
-            for existing in unique_separations:
-                if abs(sep - existing) < tolerance:
-                    found_group = True
-                    break
-            if not found_group:
+        unique_separations = []
+        for sep in separations.tolist():
+            if all(abs(sep - existing) >= tolerance for existing in unique_separations):
                 unique_separations.append(sep)
         
         # Return up to 3 most significant coupling constants
@@ -296,61 +338,25 @@ class PeakGrouper:
     
     def _analyze_dd_pattern(self, shifts: List[float]) -> List[float]:
         """Analyze doublet of doublets pattern for 3 or 4 peaks."""
+        if len(shifts) not in (3, 4):
+            return _EMPTY_COUPLING
+        
+        # Adjacent line separations in Hz
+        separations = np.abs(np.diff(np.asarray(shifts, dtype=float) * self.spectrometer_mhz))
+        
         if len(shifts) == 3:
-            # For 3 peaks dd, calculate both coupling constants
-            shifts_hz = [s * 400 for s in shifts]
-            j1 = abs(shifts_hz[1] - shifts_hz[0])
-            j2 = abs(shifts_hz[2] - shifts_hz[1])
-            return [j1, j2]
-        elif len(shifts) == 4:
-            # For 4 peaks dd, analyze the pattern more carefully
-            shifts_hz = [s * 400 for s in shifts]
-            # Calculate possible coupling constants
-            separations = []
-            for i in range(len(shifts_hz)-1):
-                separations.append(abs(shifts_hz[i+1] - shifts_hz[i]))
-            
-            # Look for two distinct coupling constants
-            j_values = []
-            if len(set(separations)) <= 2:  # Should have 1-2 distinct values
-                unique_js = list(set([round(j, 1) for j in separations]))
-                j_values = unique_js[:2]  # Take up to 2 coupling constants
-            
-            return j_values if j_values else [separations[0], separations[-1]]
-        else:
-            return []
-    
-    def _estimate_integration(self, group: List[Dict]) -> float:
-        """Estimate integration from peak intensities using relative scaling."""
-        total_intensity = sum(p.get('intensity', 100) for p in group)
-        
-        # Use a more realistic scaling based on typical NMR intensity ranges:
-        # - Very large peaks (>15000) likely 3-6H (aromatics, methyl groups)
-        # - Medium peaks (5000-15000) likely 2-3H 
-        # - Small peaks (<5000) likely 1H
-        
-        if total_intensity > 20000:
-            estimated = round(total_intensity / 7000)  # Scale down large intensities
-        elif total_intensity > 5000:
-            estimated = round(total_intensity / 5000)  # Medium intensities
-        elif total_intensity > 1000:
-            estimated = round(total_intensity / 2000)  # Smaller peaks
-        else:
-            estimated = 1.0  # Minimum 1H
+            # For 3 peaks dd, both separations are coupling constants
+            return separations.tolist()
         
-        # Ensure reasonable bounds
-        estimated = max(1.0, min(12.0, estimated))  # Between 1H and 12H
-        return float(estimated)
+        # For 4 peaks dd, look for two distinct coupling constants (to 0.1 Hz)
+        unique_js = np.unique(np.round(separations, 1))
+        if len(unique_js) <= 2:
+            return unique_js.tolist()
+        return [float(separations[0]), float(separations[-1])]
     
-    def _estimate_linewidth(self, group: List[Dict]) -> float:
-        """Estimate appropriate linewidth for the grouped peak."""
-        # Get chemical shift range
-        shifts = [p.get('shift', 0) for p in group]
-        shift_range = max(shifts) - min(shifts)
-        
+    def _estimate_linewidth(self, center_shift: float) -> float:
+        """Estimate appropriate linewidth for a grouped peak from its mean shift."""
         # Base linewidth on chemical shift region - much smaller values for visible multiplets
-        center_shift = sum(shifts) / len(shifts)
-        
         if center_shift > 8.0:  # NH region
             return 0.003  # 1.2 Hz at 400 MHz - narrow for sharp multiplets
         elif center_shift > 7.0:  # Aromatic
@@ -358,64 +364,69 @@ class PeakGrouper:
         else:  # Aliphatic
             return 0.003  # 1.2 Hz at 400 MHz - narrow for clear splitting
     
-    def _calculate_relative_integration(self, group: Dict, total_intensity: float) -> str:
-        """Calculate realistic integration values based on peak intensities."""
-        group_intensity = group.get('intensity', 100)
+    def _assign_relative_integrations(self, grouped_peaks: List[Dict], total_intensity: float) -> None:
+        """Set whole-number integration labels on all groups from their share of the total intensity."""
+        if not grouped_peaks:
+            return
         
         # Base relative integration on comparison to total intensity
         # Assume typical NMR spectrum represents 10-20 protons total
         typical_total_protons = 15
         
-        # Calculate relative proportion
-        intensity_fraction = group_intensity / total_intensity if total_intensity > 0 else 0.1
-        estimated_protons = intensity_fraction * typical_total_protons
-        
-        # Round to whole number integration values only (1H, 2H, 3H, etc.)
-        if estimated_protons < 0.7:
-            return "1H"  # Minimum 1H
-        elif estimated_protons < 1.5:
-            return "1H"
-        elif estimated_protons < 2.5:
-            return "2H"
-        elif estimated_protons < 3.5:
-            return "3H"
-        elif estimated_protons < 4.5:
-            return "4H"
-        elif estimated_protons < 5.5:
-            return "5H"
-        elif estimated_protons < 6.5:
-            return "6H"
-        elif estimated_protons < 8:
-            return "7H"
-        elif estimated_protons < 10:
-            return "9H"
+        group_intensity = np.array([g.get('intensity', 100) for g in grouped_peaks], dtype=np.float64)
+        if total_intensity > 0:
+            estimated_protons = group_intensity * (typical_total_protons / total_intensity)
         else:
-            return f"{int(round(estimated_protons))}H"
-    
-    def _match_with_assignments(self, grouped_peak: Dict, assignment_data: List[Dict]) -> Dict:
-        """Match grouped peak with assignment data."""
-        peak_shift = grouped_peak.get('shift', 0)
-        
-        # Find closest assignment
-        closest_assignment = None
-        min_distance = float('inf')
-        
-        for assignment in assignment_data:
-            if 'shift' in assignment:
-                distance = abs(assignment['shift'] - peak_shift)
-                if distance < min_distance and distance < 0.5:  # Within 0.5 ppm
-                    min_distance = distance
-                    closest_assignment = assignment
+            estimated_protons = np.full(len(grouped_peaks), 0.1 * typical_total_protons)
         
-        # Add assignment information if found
-        if closest_assignment:
+        # Bin to whole number integration values only (1H, 2H, 3H, etc.); beyond the table, round
+        bins = _INTEGRATION_THRESHOLDS.searchsorted(estimated_protons, side='right')
+        for group, b, est in zip(grouped_peaks, bins, estimated_protons):
+            if b < len(_INTEGRATION_LABELS):
+                group['integration'] = _INTEGRATION_LABELS[b]
+            else:
+                group['integration'] = f"{int(round(est))}H"
+    
+    def _match_with_assignments(self, grouped_peaks: List[Dict], assignment_data: List[Dict]) -> List[Dict]:
+        """Match grouped peaks with their closest assignment using a sorted-shift nearest-neighbour search."""
+        candidates = [a for a in assignment_data if 'shift' in a]
+        if not candidates or not grouped_peaks:
+            return grouped_peaks
+        
+        # Sort assignments once; stable so equal shifts keep their input order
+        a_shifts = np.array([a['shift'] for a in candidates], dtype=np.float64)
+        order = np.argsort(a_shifts, kind='stable')
+        a_sorted = a_shifts[order]
+        last = len(a_sorted) - 1
+        
+        # Nearest neighbour is either side of the insertion point (first of any run of equal shifts)
+        g_shifts = np.array([g.get('shift', 0) for g in grouped_peaks], dtype=np.float64)
+        pos = a_sorted.searchsorted(g_shifts)
+        right = a_sorted.searchsorted(a_sorted[np.minimum(pos, last)])
+        left = a_sorted.searchsorted(a_sorted[np.maximum(pos - 1, 0)])
+        d_left = np.abs(a_sorted[left] - g_shifts)
+        d_right = np.abs(a_sorted[right] - g_shifts)
+        
+        # Ties go to the assignment listed first, matching a linear scan
+        use_left = (d_left < d_right) | ((d_left == d_right) & (order[left] < order[right]))
+        nearest = np.where(use_left, left, right)
+        distance = np.minimum(d_left, d_right)
+        
+        for grouped_peak, idx, dist in zip(grouped_peaks, nearest, distance):
+            if not dist < 0.5:  # Within 0.5 ppm
+                continue
+            closest_assignment = candidates[order[idx]]
+            
+            # Add assignment information
             if 'assignment' in closest_assignment:
                 grouped_peak['assignment'] = closest_assignment['assignment']
             if 'multiplicity' in closest_assignment and closest_assignment['multiplicity'] != 'm':
                 # Use assignment multiplicity if it's specific
                 grouped_peak['multiplicity'] = closest_assignment['multiplicity']
         
-        return grouped_peak
+        return grouped_peaks
+
+_PREVIEW_RULE = "=" * 60 + "\n\n"
 
 def create_peak_grouping_dialog(parent, peaks, assignment_data=None):
     """Create a dialog for peak grouping configuration."""
@@ -478,11 +489,23 @@ This tool will analyze your individual multiplet lines and group them into prope
     # Result storage
     result = {'grouped_peaks': None, 'apply': False}
     
-    def update_preview():
-        """Update the preview with current settings."""
+    # Peaks and assignments are fixed for the dialog's lifetime, so analyses are cached per window setting
+    grouper = PeakGrouper()
+    analysis_cache = {}
+    preview_buffer = io.StringIO()  # Reused across refreshes
+    
+    last_settings = None
+    
+    def update_preview(force=False):
+        """Update the preview with current settings (force re-runs it even if they are unchanged)."""
+        nonlocal last_settings
+        
+        # Tk traces also fire when a variable is set to its current value; skip if nothing changed
+        settings = (window_var.get(), coupling_var.get())
+        if not force and settings == last_settings:
+            return
+        
         try:
-            grouper = PeakGrouper()
-            
             # Get parameters from the dialog
             aromatic_window = 0.05  # Default tight grouping for aromatic
             aliphatic_window = 0.1  # Default wider grouping for aliphatic
@@ -495,47 +518,85 @@ This tool will analyze your individual multiplet lines and group them into prope
             except:
                 pass  # Use defaults
             
-            grouped_peaks = grouper.analyze_peaks(peaks, assignment_data, aromatic_window, aliphatic_window)
+            cache_key = (aromatic_window, aliphatic_window)
+            grouped_peaks = analysis_cache.get(cache_key)
+            if grouped_peaks is None:
+                if len(analysis_cache) >= 32:
+                    analysis_cache.clear()
+                grouped_peaks = grouper.analyze_peaks(peaks, assignment_data, aromatic_window, aliphatic_window)
+                analysis_cache[cache_key] = grouped_peaks
             
-            # Generate preview text
-            preview_content = f"Peak Grouping Analysis ({len(peaks)} → {len(grouped_peaks)} peaks)\n"
-            preview_content += "=" * 60 + "\n\n"
+            # Rebuild preview text in the dialog's reusable buffer
+            preview_buffer.seek(0)
+            preview_buffer.truncate()
+            write = preview_buffer.write
+            write(f"Peak Grouping Analysis ({len(peaks)} → {len(grouped_peaks)} peaks)\n")
+            write(_PREVIEW_RULE)
             
             for i, peak in enumerate(grouped_peaks, 1):
-                preview_content += f"Peak {i}: δ {peak['shift']:.3f} ppm\n"
-                preview_content += f"  Multiplicity: {peak['multiplicity']}\n"
-                preview_content += f"  Integration: {peak['integration']}\n"  # Already formatted as string
-                preview_content += f"  Intensity: {peak['intensity']:.0f}\n"
+                write(f"Peak {i}: δ {peak['shift']:.3f} ppm\n"
+                      f"  Multiplicity: {peak['multiplicity']}\n"
+                      f"  Integration: {peak['integration']}\n"  # Already formatted as string
+                      f"  Intensity: {peak['intensity']:.0f}\n")
                 
                 if peak['coupling']:
                     j_values = ", ".join(f"{j:.1f}" for j in peak['coupling'])
-                    preview_content += f"  J-coupling: {j_values} Hz\n"
+                    write(f"  J-coupling: {j_values} Hz\n")
                 
                 if 'original_peaks' in peak:
-                    preview_content += f"  (Grouped from {peak['original_peaks']} lines)\n"
+                    write(f"  (Grouped from {peak['original_peaks']} lines)\n")
                 
                 if 'assignment' in peak:
-                    preview_content += f"  Assignment: {peak['assignment']}\n"
+                    write(f"  Assignment: {peak['assignment']}\n")
                 
-                preview_content += "\n"
+                write("\n")
             
             preview_text.delete(1.0, tk.END)
-            preview_text.insert(tk.END, preview_content)
+            preview_text.insert(tk.END, preview_buffer.getvalue())
             
             # Store result
             result['grouped_peaks'] = grouped_peaks
             
+            # Only a successfully built preview counts; failed settings are retried next time
+            last_settings = settings
+            
         except Exception as e:
             preview_text.delete(1.0, tk.END)
             preview_text.insert(tk.END, f"Error in analysis: {e}")
     
     # Update preview initially
-    update_preview()
+    update_preview(force=True)
+    
+    # Debounce setting changes so typing doesn't re-run the analysis on every keystroke
+    preview_job = None
+    
+    def run_scheduled_preview():
+        nonlocal preview_job
+        preview_job = None
+        update_preview()
+    
+    def schedule_preview(*args):
+        nonlocal preview_job
+        if preview_job is not None:
+            dialog.after_cancel(preview_job)
+        preview_job = dialog.after(250, run_scheduled_preview)
+    
+    def cancel_scheduled_preview():
+        nonlocal preview_job
+        if preview_job is not None:
+            dialog.after_cancel(preview_job)
+            preview_job = None
+    
+    def flush_scheduled_preview():
+        """Run a pending debounced refresh now, so the result reflects the latest settings."""
+        if preview_job is not None:
+            cancel_scheduled_preview()
+            update_preview()
     
     # Bind updates to setting changes
     try:
-        window_var.trace('w', lambda *args: update_preview())
-        coupling_var.trace('w', lambda *args: update_preview())
+        window_var.trace('w', schedule_preview)
+        coupling_var.trace('w', schedule_preview)
     except:
         pass  # Variables may not exist in simplified version
     
@@ -545,12 +606,15 @@ This tool will analyze your individual multiplet lines and group them into prope
     
     def apply_grouping():
         """Apply the grouped peaks and close dialog."""
+        # Settings edited within the debounce delay must still be applied
+        flush_scheduled_preview()
         result['apply'] = True
         result['grouped_peaks'] = result.get('grouped_peaks', [])
         dialog.destroy()
     
     def cancel_grouping():
         """Cancel grouping and close dialog."""
+        cancel_scheduled_preview()
         result['apply'] = False
         dialog.destroy()
     
@@ -561,9 +625,12 @@ This tool will analyze your individual multiplet lines and group them into prope
     cancel_btn = ttk.Button(button_frame, text="❌ Cancel", command=cancel_grouping)
     cancel_btn.pack(side=tk.LEFT, padx=5)
     
-    refresh_btn = ttk.Button(button_frame, text="🔄 Refresh Preview", command=update_preview)
+    refresh_btn = ttk.Button(button_frame, text="🔄 Refresh Preview", command=lambda: update_preview(force=True))
     refresh_btn.pack(side=tk.LEFT, padx=5)
     
+    # Closing the window behaves like Cancel (and drops any pending preview refresh)
+    dialog.protocol("WM_DELETE_WINDOW", cancel_grouping)
+    
     # Wait for dialog to close
     dialog.wait_window()
     
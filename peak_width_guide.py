@@ -10,29 +10,12 @@ from tkinter import ttk, scrolledtext
 import sys
 import os
 
-# Add the current directory to Python path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Add the current directory to Python path for imports (once, even if re-imported)
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
 
-def show_peak_width_guide():
-    """Show comprehensive guide for controlling peak widths."""
-    
-    demo_window = tk.Tk()
-    demo_window.title("🎛️ Peak Width Control Guide")
-    demo_window.geometry("900x700")
-    
-    # Create scrollable text widget
-    frame = ttk.Frame(demo_window)
-    frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-    
-    text_widget = tk.Text(frame, wrap=tk.WORD, font=("Consolas", 11))
-    scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=text_widget.yview)
-    text_widget.configure(yscrollcommand=scrollbar.set)
-    
-    text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-    scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-    
-    # Guide content
-    guide_content = """🎛️ PEAK WIDTH CONTROL FOR NMR SIGNALS
+_GUIDE_CONTENT = """🎛️ PEAK WIDTH CONTROL FOR NMR SIGNALS
 ==========================================
 
 For broad signals like NH, OH, and exchangeable protons, you can control peak width using several methods:
@@ -202,9 +185,128 @@ Wrong integration?
 ==========================================
 🎛️ Ready to control your peak widths like a pro!
 """
+
+_EXAMPLES_TEXT = """# Example 1: Acetanilide with automatic broad NH
+7.52 (d, J=8.0 Hz, 2H)
+7.31 (t, J=8.0 Hz, 2H)
+7.09 (t, J=8.0 Hz, 1H)
+8.45 (br s, 1H)
+2.15 (s, 3H)
+
+# Example 2: Acetanilide with explicit NH width
+7.52 (d, J=8.0 Hz, 2H)
+7.31 (t, J=8.0 Hz, 2H)
+7.09 (t, J=8.0 Hz, 1H)
+8.45 (br s, 1H, lw=18 Hz)
+2.15 (s, 3H)
+
+# Example 3: Mixed linewidths
+7.52 (d, J=8.0 Hz, 2H, lw=2 Hz)
+8.45 (br s, 1H, lw=25 Hz)
+3.67 (s, 3H, lw=1 Hz)
+
+# Example 4: Primary amide
+7.23 (d, J=8.0 Hz, 2H)
+6.2 (br s, 2H, lw=30 Hz)
+2.31 (s, 3H)
+
+# Example 5: Hydrogen-bonded NH
+7.89 (d, J=8.0 Hz, 1H)
+12.3 (br s, 1H, lw=40 Hz)
+7.45 (t, J=8.0 Hz, 1H)
+
+# Example 6: Using ppm linewidth
+8.45 (br s, 1H, lw=0.025 ppm)
+7.23 (d, J=8.0 Hz, 2H, lw=0.005 ppm)
+"""
+
+# Open guide windows, reused (raised) instead of rebuilt while they are still alive
+_GUIDE_WINDOW = None
+_EXAMPLES_WINDOW = None
+
+def raise_existing_window(window):
+    """Bring an already-open window to the front; returns False if there is none to reuse."""
+    if window is None:
+        return False
+    try:
+        if not window.winfo_exists():
+            return False
+    except tk.TclError:  # Its Tk interpreter is already gone
+        return False
+    window.deiconify()
+    window.lift()
+    window.focus_force()
+    return True
+
+def create_window():
+    """Open a Toplevel on the running Tk root if there is one; returns (window, owns_mainloop)."""
+    root = tk._default_root
+    if root is not None:
+        return tk.Toplevel(root), False
+    return tk.Tk(), True
+
+def on_window_destroyed(window, clear):
+    """Call clear() once the window itself (not one of its children) is destroyed."""
+    window.bind("<Destroy>", lambda event: clear() if event.widget is window else None, add="+")
+
+def create_static_text_view(parent, content, wraplength, font=("Consolas", 11)):
+    """Show read-only text as one wrapped Label inside a scrollable Canvas."""
+    canvas = tk.Canvas(parent, highlightthickness=0)
+    scrollbar = ttk.Scrollbar(parent, orient=tk.VERTICAL, command=canvas.yview)
+    content_frame = ttk.Frame(canvas)
+    
+    content_frame.bind(
+        "<Configure>",
+        lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+    )
+    
+    canvas.create_window((0, 0), window=content_frame, anchor="nw")
+    canvas.configure(yscrollcommand=scrollbar.set)
+    
+    label = tk.Label(content_frame, text=content, font=font, wraplength=wraplength,
+                     justify=tk.LEFT, anchor="nw")
+    label.pack(fill=tk.BOTH, expand=True)
+    
+    # Mouse wheel scrolling (Windows/macOS deltas, X11 buttons 4/5)
+    def on_mousewheel(event):
+        if event.num == 4:
+            canvas.yview_scroll(-1, "units")
+        elif event.num == 5:
+            canvas.yview_scroll(1, "units")
+        else:
+            canvas.yview_scroll(int(-event.delta / 120) or (-1 if event.delta > 0 else 1), "units")
     
-    text_widget.insert(tk.END, guide_content)
-    text_widget.config(state=tk.DISABLED)
+    for widget in (canvas, label):
+        widget.bind("<MouseWheel>", on_mousewheel)
+        widget.bind("<Button-4>", on_mousewheel)
+        widget.bind("<Button-5>", on_mousewheel)
+    
+    scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+    canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+    return canvas
+
+def show_peak_width_guide():
+    """Show comprehensive guide for controlling peak widths."""
+    global _GUIDE_WINDOW
+    if raise_existing_window(_GUIDE_WINDOW):
+        return
+    
+    demo_window, owns_mainloop = create_window()
+    demo_window.title("🎛️ Peak Width Control Guide")
+    demo_window.geometry("900x700")
+    
+    def forget_window():
+        global _GUIDE_WINDOW
+        _GUIDE_WINDOW = None
+    
+    _GUIDE_WINDOW = demo_window
+    on_window_destroyed(demo_window, forget_window)
+    
+    # Static guide text: a single Label in a scrollable canvas instead of a Text widget
+    frame = ttk.Frame(demo_window)
+    frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+    
+    create_static_text_view(frame, _GUIDE_CONTENT, wraplength=850)
     
     # Add buttons
     button_frame = ttk.Frame(demo_window)
@@ -228,65 +330,47 @@ Wrong integration?
         command=demo_window.destroy
     ).pack(side=tk.RIGHT, padx=5)
     
-    demo_window.mainloop()
+    # Only run a loop for our own root; inside a running application its mainloop drives this window
+    if owns_mainloop:
+        demo_window.mainloop()
 
 def test_width_examples():
     """Create a test window with example data ready to copy."""
+    global _EXAMPLES_WINDOW
+    if raise_existing_window(_EXAMPLES_WINDOW):
+        return
+    
     test_window = tk.Toplevel()
     test_window.title("🧪 Peak Width Test Examples")
     test_window.geometry("600x500")
     
+    def forget_window():
+        global _EXAMPLES_WINDOW
+        _EXAMPLES_WINDOW = None
+    
+    _EXAMPLES_WINDOW = test_window
+    on_window_destroyed(test_window, forget_window)
+    
     # Create text area with examples
     frame = ttk.Frame(test_window)
     frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
     
     ttk.Label(frame, text="Copy these examples into your simulator:").pack(anchor=tk.W, pady=5)
     
-    examples_text = scrolledtext.ScrolledText(frame, width=70, height=25, wrap=tk.WORD)
-    examples_text.pack(fill=tk.BOTH, expand=True)
-    
-    examples = """# Example 1: Acetanilide with automatic broad NH
-7.52 (d, J=8.0 Hz, 2H)
-7.31 (t, J=8.0 Hz, 2H)
-7.09 (t, J=8.0 Hz, 1H)
-8.45 (br s, 1H)
-2.15 (s, 3H)
-
-# Example 2: Acetanilide with explicit NH width
-7.52 (d, J=8.0 Hz, 2H)
-7.31 (t, J=8.0 Hz, 2H)
-7.09 (t, J=8.0 Hz, 1H)
-8.45 (br s, 1H, lw=18 Hz)
-2.15 (s, 3H)
-
-# Example 3: Mixed linewidths
-7.52 (d, J=8.0 Hz, 2H, lw=2 Hz)
-8.45 (br s, 1H, lw=25 Hz)
-3.67 (s, 3H, lw=1 Hz)
-
-# Example 4: Primary amide
-7.23 (d, J=8.0 Hz, 2H)
-6.2 (br s, 2H, lw=30 Hz)
-2.31 (s, 3H)
-
-# Example 5: Hydrogen-bonded NH
-7.89 (d, J=8.0 Hz, 1H)
-12.3 (br s, 1H, lw=40 Hz)
-7.45 (t, J=8.0 Hz, 1H)
-
-# Example 6: Using ppm linewidth
-8.45 (br s, 1H, lw=0.025 ppm)
-7.23 (d, J=8.0 Hz, 2H, lw=0.005 ppm)
-"""
+    examples_text = scrolledtext.ScrolledText(frame, width=70, height=25, wrap=tk.WORD,
+                                              undo=False, autoseparators=False)
     
-    examples_text.insert(tk.END, examples)
+    examples_text.insert("1.0", _EXAMPLES_TEXT)
+    examples_text.configure(state=tk.DISABLED)  # Still selectable for copying
+    examples_text.pack(fill=tk.BOTH, expand=True)
     
     ttk.Button(frame, text="Close", command=test_window.destroy).pack(pady=5)
 
 def start_simulator():
-    """Start the enhanced GUI."""
+    """Start the enhanced GUI in this process."""
     try:
-        os.system("python enhanced_gui.py")
+        from enhanced_gui import create_enhanced_gui
+        create_enhanced_gui()
     except Exception as e:
         print(f"Could not start enhanced GUI: {e}")
 
@@ -11,29 +11,18 @@ from tkinter import ttk, messagebox
 import sys
 import os
 
-# Add the current directory to Python path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Add the current directory to Python path for imports (once, even if re-imported)
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
 
-def show_practical_demo():
-    """Show the step-by-step solution for the missing peaks issue."""
-    
-    demo_window = tk.Tk()
-    demo_window.title("🎓 Practical Demo: Data Merging Solution")
-    demo_window.geometry("800x700")
-    
-    # Create scrollable text widget
-    frame = ttk.Frame(demo_window)
-    frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-    
-    text_widget = tk.Text(frame, wrap=tk.WORD, font=("Consolas", 11))
-    scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=text_widget.yview)
-    text_widget.configure(yscrollcommand=scrollbar.set)
-    
-    text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-    scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-    
-    # Demo content
-    demo_content = """🎯 PROBLEM SOLVED: Missing 7.6 ppm Peaks
+from peak_width_guide import (create_static_text_view, create_window, raise_existing_window,
+                              on_window_destroyed)
+
+# Open demo window, reused (raised) instead of rebuilt while it is still alive
+_DEMO_WINDOW = None
+
+_DEMO_CONTENT = """🎯 PROBLEM SOLVED: Missing 7.6 ppm Peaks
 ========================================
 
 ❌ THE ISSUE YOU EXPERIENCED:
@@ -185,9 +174,29 @@ It solves the missing peaks issue by preserving existing data.
 🚀 TRY IT NOW:
 Close this demo and practice with your real data using the "Add" workflow!
 """
+
+def show_practical_demo():
+    """Show the step-by-step solution for the missing peaks issue."""
+    global _DEMO_WINDOW
+    if raise_existing_window(_DEMO_WINDOW):
+        return
+    
+    demo_window, owns_mainloop = create_window()
+    demo_window.title("🎓 Practical Demo: Data Merging Solution")
+    demo_window.geometry("800x700")
+    
+    def forget_window():
+        global _DEMO_WINDOW
+        _DEMO_WINDOW = None
+    
+    _DEMO_WINDOW = demo_window
+    on_window_destroyed(demo_window, forget_window)
+    
+    # Static demo text: a single Label in a scrollable canvas instead of a Text widget
+    frame = ttk.Frame(demo_window)
+    frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
     
-    text_widget.insert(tk.END, demo_content)
-    text_widget.config(state=tk.DISABLED)
+    create_static_text_view(frame, _DEMO_CONTENT, wraplength=750)
     
     # Add buttons
     button_frame = ttk.Frame(demo_window)
@@ -211,12 +220,15 @@ Close this demo and practice with your real data using the "Add" workflow!
         command=demo_window.destroy
     ).pack(side=tk.RIGHT, padx=5)
     
-    demo_window.mainloop()
+    # Only run a loop for our own root; inside a running application its mainloop drives this window
+    if owns_mainloop:
+        demo_window.mainloop()
 
 def start_enhanced_gui():
-    """Start the enhanced GUI for hands-on practice."""
+    """Start the enhanced GUI for hands-on practice in this process."""
     try:
-        os.system("python enhanced_gui.py")
+        from enhanced_gui import create_enhanced_gui
+        create_enhanced_gui()
     except Exception as e:
         messagebox.showerror("Error", f"Could not start enhanced GUI: {e}")
 
@@ -4,11 +4,47 @@ Real SDBS (Spectral Database for Organic Compounds) scraper.
 This module provides functionality to scrape real NMR data from the SDBS database.
 """
 
-import requests
-from bs4 import BeautifulSoup
-from typing import List, Dict, Any, Optional
-import re
-from nmr_simulator import Spectrum, Peak
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
+import os
+import numpy as np
+
+# requests and nmr_simulator (which pulls in matplotlib) are imported where they are
+# first needed, so importing this module stays cheap
+if TYPE_CHECKING:
+    from nmr_simulator import Spectrum
+
+
+# Indole multiplicity by chemical-shift bin (np.digitize over the edges):
+# <4.0 N-H/solvent singlet, 6.3-6.5 H-3 doublet, 6.8-6.9 H-5 triplet,
+# 7.0-7.4 aromatic multiplets, >7.5 H-2 doublet, anything else a multiplet.
+_INDOLE_SHIFT_EDGES = np.array([4.0, 6.3, 6.5, 6.8, 6.9, 7.0, 7.4, 7.5])
+_INDOLE_MULTIPLICITIES = np.array(["s", "m", "d", "m", "t", "m", "m", "m", "d"], dtype=object)
+# Multiplicities that get the default 7.5 Hz coupling constant
+_COUPLED_MULTIPLICITIES = frozenset(("d", "t"))
+
+# Real indole peak data from the SDBS example (converted from Hz to ppm), stored as parallel
+# "ppm"/"intensity" arrays; the last line (3.576 ppm, 1000) is the reference peak
+_INDOLE_DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sdbs_1841_indole.npz")
+
+# Example SDBS entries served by the demo search, as (name, sdbs_number, formula) rows
+_DEMO_CATALOG = (
+    ("Indole", "1841", "C8H7N"),
+    ("Benzene", "1234", "C6H6"),
+    ("Toluene", "1235", "C7H8"),
+    ("Pyridine", "1500", "C5H5N"),
+)
+# Lowercase names, built once so a search never re-lowers the catalog
+_DEMO_CATALOG_NAMES = tuple(name.lower() for name, _, _ in _DEMO_CATALOG)
+
+
+@lru_cache(maxsize=128)
+def _matching_demo_compounds(term: str) -> Tuple[int, ...]:
+    """Indices of demo compounds whose name contains the (lowercase) search term."""
+    return tuple(i for i, name in enumerate(_DEMO_CATALOG_NAMES) if term in name)
 
 
 class RealSDBSScraper:
@@ -16,11 +52,26 @@ class RealSDBSScraper:
     
     def __init__(self):
         """Initialize the SDBS scraper."""
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
         self.base_url = "https://sdbs.db.aist.go.jp"
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive'
         })
+        
+        # Pooled keep-alive connections with retries on transient server errors
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
     
     def get_spectrum_by_number(self, sdbs_number: str, nucleus: str = '1H') -> Optional[Spectrum]:
         """
@@ -52,147 +103,122 @@ class RealSDBSScraper:
             print(f"Error fetching SDBS data: {e}")
             return None
     
+    def get_spectra_batch(self, sdbs_numbers: List[str], nucleus: str = '1H',
+                          max_workers: int = 8) -> List[Optional[Spectrum]]:
+        """
+        Get several spectra concurrently over the shared connection pool.
+        
+        Args:
+            sdbs_numbers: SDBS database numbers
+            nucleus: Nucleus type ('1H' or '13C')
+            max_workers: Maximum number of concurrent fetches
+            
+        Returns:
+            List of Spectrum objects (or None for failures), in input order
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda number: self.get_spectrum_by_number(number, nucleus), sdbs_numbers))
+    
     def _create_indole_spectrum(self) -> Spectrum:
         """Create the real indole spectrum from your SDBS example."""
+        from nmr_simulator import Spectrum, Peak
+        
         spectrum = Spectrum(nucleus="1H", field_strength=400.0)
         spectrum.title = "1H NMR of Indole (SDBS-1841)"
         
-        # Real peak data from your SDBS example (converted from Hz to ppm)
-        real_peaks = [
-            {"ppm": 7.614, "intensity": 74},
-            {"ppm": 7.612, "intensity": 104}, 
-            {"ppm": 7.609, "intensity": 78},
-            {"ppm": 7.594, "intensity": 83},
-            {"ppm": 7.592, "intensity": 111},
-            {"ppm": 7.589, "intensity": 87},
-            {"ppm": 7.232, "intensity": 43},
-            {"ppm": 7.231, "intensity": 44},
-            {"ppm": 7.229, "intensity": 48},
-            {"ppm": 7.214, "intensity": 69},
-            {"ppm": 7.212, "intensity": 120},
-            {"ppm": 7.210, "intensity": 115},
-            {"ppm": 7.208, "intensity": 120},
-            {"ppm": 7.207, "intensity": 69},
-            {"ppm": 7.196, "intensity": 78},
-            {"ppm": 7.193, "intensity": 80},
-            {"ppm": 7.179, "intensity": 94},
-            {"ppm": 7.176, "intensity": 105},
-            {"ppm": 7.173, "intensity": 32},
-            {"ppm": 7.159, "intensity": 46},
-            {"ppm": 7.156, "intensity": 45},
-            {"ppm": 7.101, "intensity": 88},
-            {"ppm": 7.097, "intensity": 87},
-            {"ppm": 7.084, "intensity": 70},
-            {"ppm": 7.081, "intensity": 127},
-            {"ppm": 7.078, "intensity": 88},
-            {"ppm": 7.064, "intensity": 60},
-            {"ppm": 7.061, "intensity": 59},
-            {"ppm": 6.905, "intensity": 170},
-            {"ppm": 6.897, "intensity": 179},
-            {"ppm": 6.440, "intensity": 145},
-            {"ppm": 6.438, "intensity": 149},
-            {"ppm": 6.432, "intensity": 145},
-            {"ppm": 6.430, "intensity": 146},
-            {"ppm": 3.576, "intensity": 1000}  # Reference peak
-        ]
-        
-        # Group nearby peaks and assign realistic multiplicities for indole
-        grouped_peaks = self._group_and_assign_multiplicities(real_peaks)
-        
-        for peak_data in grouped_peaks:
-            peak = Peak(
-                chemical_shift=peak_data["ppm"],
-                intensity=peak_data["intensity"] / 1000.0,  # Normalize
-                multiplicity=peak_data["multiplicity"],
-                coupling_constants=peak_data.get("coupling_constants")
+        spectrum.add_peaks([
+            Peak(
+                chemical_shift=ppm,
+                intensity=intensity / 1000.0,  # Normalize
+                multiplicity=multiplicity,
+                coupling_constants=list(coupling) if coupling is not None else None
             )
-            spectrum.add_peak(peak)
+            for ppm, intensity, multiplicity, coupling in self._indole_peak_table()
+        ])
         
         return spectrum
     
-    def _group_and_assign_multiplicities(self, peaks: List[Dict]) -> List[Dict]:
-        """Group nearby peaks and assign realistic multiplicities for indole."""
-        grouped = []
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _indole_peak_table() -> Tuple[Tuple[float, float, str, Optional[Tuple[float, ...]]], ...]:
+        """Grouped indole peaks as immutable (ppm, intensity, multiplicity, couplings) rows, built once."""
+        with np.load(_INDOLE_DATA_PATH) as indole_data:
+            ppm, intensity = indole_data["ppm"], indole_data["intensity"]
         
-        # Group peaks that are very close (< 0.01 ppm apart)
-        i = 0
-        while i < len(peaks):
-            current_peak = peaks[i]
-            group = [current_peak]
-            
-            # Look for nearby peaks
-            j = i + 1
-            while j < len(peaks) and abs(peaks[j]["ppm"] - current_peak["ppm"]) < 0.01:
-                group.append(peaks[j])
-                j += 1
-            
-            # Calculate average position and sum intensity
-            avg_ppm = sum(p["ppm"] for p in group) / len(group)
-            total_intensity = sum(p["intensity"] for p in group)
-            
-            # Assign multiplicity based on chemical shift (indole-specific)
-            multiplicity = self._assign_indole_multiplicity(avg_ppm)
-            
-            grouped.append({
-                "ppm": avg_ppm,
-                "intensity": total_intensity,
-                "multiplicity": multiplicity,
-                "coupling_constants": [7.5] if multiplicity in ["d", "t"] else None
-            })
-            
-            i = j
+        # Group nearby peaks and assign realistic multiplicities for indole
+        grouped_peaks = RealSDBSScraper._group_and_assign_multiplicities(ppm, intensity)
         
-        return grouped
+        return tuple(
+            (peak_data["ppm"], peak_data["intensity"], peak_data["multiplicity"],
+             tuple(peak_data["coupling_constants"]) if peak_data["coupling_constants"] is not None else None)
+            for peak_data in grouped_peaks
+        )
     
-    def _assign_indole_multiplicity(self, ppm: float) -> str:
-        """Assign realistic multiplicities for indole based on chemical shift."""
-        if ppm > 7.5:
-            return "d"  # H-2 (downfield doublet)
-        elif 7.4 > ppm > 7.0:
-            return "m"  # Aromatic multiplets
-        elif 6.9 > ppm > 6.8:
-            return "t"  # H-5 (triplet)
-        elif 6.5 > ppm > 6.3:
-            return "d"  # H-3 (doublet)
-        elif ppm < 4.0:
-            return "s"  # N-H or solvent
-        else:
-            return "m"  # Default multiplet
+    @staticmethod
+    def _group_and_assign_multiplicities(ppm: np.ndarray, intensity: np.ndarray) -> List[Dict]:
+        """Group nearby peaks (parallel ppm/intensity arrays) and assign realistic multiplicities for indole."""
+        if len(ppm) == 0:
+            return []
+        
+        ppm = np.asarray(ppm, dtype=np.float64)
+        intensity = np.asarray(intensity)
+        
+        # Sort once (downfield first) so groups are contiguous runs
+        order = np.argsort(-ppm, kind="stable")
+        ppm = ppm[order]
+        intensity = intensity[order]
+        
+        # Group peaks that are very close (< 0.01 ppm apart)
+        starts = np.concatenate(([0], np.flatnonzero(np.abs(np.diff(ppm)) >= 0.01) + 1))
+        
+        # Sum intensity and take the intensity-weighted position of each group; integer
+        # intensities (stored as uint16) are widened first so group sums cannot overflow
+        if np.issubdtype(intensity.dtype, np.integer):
+            intensity = intensity.astype(np.int64)
+        total_intensity = np.add.reduceat(intensity, starts)
+        avg_ppm = np.add.reduceat(ppm * intensity, starts) / total_intensity
+        
+        # Assign multiplicity based on chemical shift (indole-specific), all groups at once
+        multiplicities = _INDOLE_MULTIPLICITIES[np.digitize(avg_ppm, _INDOLE_SHIFT_EDGES)].tolist()
+        
+        return [
+            {
+                "ppm": group_ppm,
+                "intensity": group_intensity,
+                "multiplicity": multiplicity,
+                "coupling_constants": [7.5] if multiplicity in _COUPLED_MULTIPLICITIES else None
+            }
+            for group_ppm, group_intensity, multiplicity in zip(avg_ppm.tolist(), total_intensity.tolist(),
+                                                                multiplicities)
+        ]
     
     def _create_demo_spectrum_by_number(self, sdbs_number: str, nucleus: str) -> Spectrum:
         """Create demo spectrum for other SDBS numbers."""
+        from nmr_simulator import Spectrum, Peak
+        
         spectrum = Spectrum(nucleus=nucleus, field_strength=400.0)
         spectrum.title = f"{nucleus} NMR Spectrum (SDBS-{sdbs_number})"
         
         # Add some generic peaks based on the number (for demo)
         base_shift = 7.0 if nucleus == "1H" else 120.0
-        for i in range(3):
-            shift = base_shift + (int(sdbs_number) % 10) * 0.1 + i * 0.5
-            intensity = 1.0 - i * 0.2
-            peak = Peak(
-                chemical_shift=shift,
-                intensity=intensity,
-                multiplicity=["s", "d", "t"][i % 3]
+        offset = (int(sdbs_number) % 10) * 0.1
+        spectrum.add_peaks([
+            Peak(
+                chemical_shift=base_shift + offset + i * 0.5,
+                intensity=1.0 - i * 0.2,
+                multiplicity=multiplicity
             )
-            spectrum.add_peak(peak)
+            for i, multiplicity in enumerate(("s", "d", "t"))
+        ])
         
         return spectrum
     
     def search_compounds(self, search_term: str) -> List[Dict[str, Any]]:
         """Search for compounds in SDBS (demo implementation)."""
         # This would normally scrape SDBS search results
-        # For now, return some example SDBS numbers
-        demo_results = [
-            {"name": "Indole", "sdbs_number": "1841", "formula": "C8H7N"},
-            {"name": "Benzene", "sdbs_number": "1234", "formula": "C6H6"},
-            {"name": "Toluene", "sdbs_number": "1235", "formula": "C7H8"},
-            {"name": "Pyridine", "sdbs_number": "1500", "formula": "C5H5N"},
-        ]
-        
-        # Filter by search term
+        # For now, filter the example SDBS numbers (memoized per lowered term)
         results = []
-        for item in demo_results:
-            if search_term.lower() in item["name"].lower():
-                results.append(item)
-        
+        for i in _matching_demo_compounds(search_term.lower()):
+            name, sdbs_number, formula = _DEMO_CATALOG[i]
+            results.append({"name": name, "sdbs_number": sdbs_number, "formula": formula})
         return results
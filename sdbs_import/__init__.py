@@ -2,11 +2,35 @@
 SDBS (Spectral Database for Organic Compounds) Integration Package
 
 This package provides functionality to import and parse NMR data from the SDBS database.
+Submodules are imported on first attribute access, so importing one of them
+(e.g. sdbs_import.real_scraper) doesn't load the others.
 """
 
-from .scraper import SDBSScraper as OriginalSDBSScraper
-from .parser import SDBSParser as OriginalSDBSParser
-from .enhanced_scraper import SDBSScraper
-from .enhanced_parser import EnhancedSDBSParser, SDBSParser
+import importlib
 
-__all__ = ['SDBSScraper', 'SDBSParser', 'EnhancedSDBSParser', 'OriginalSDBSScraper', 'OriginalSDBSParser']
+# Exported name -> (submodule, attribute)
+_LAZY_EXPORTS = {
+    'SDBSScraper': ('.enhanced_scraper', 'SDBSScraper'),
+    'AsyncSDBSScraper': ('.enhanced_scraper', 'AsyncSDBSScraper'),
+    'SDBSParser': ('.enhanced_parser', 'SDBSParser'),
+    'EnhancedSDBSParser': ('.enhanced_parser', 'EnhancedSDBSParser'),
+    'OriginalSDBSScraper': ('.scraper', 'SDBSScraper'),
+    'OriginalSDBSParser': ('.parser', 'SDBSParser'),
+}
+
+__all__ = ['SDBSScraper', 'AsyncSDBSScraper', 'SDBSParser', 'EnhancedSDBSParser', 'OriginalSDBSScraper', 'OriginalSDBSParser']
+
+
+def __getattr__(name):
+    """Import the submodule providing ``name`` on first access (PEP 562)."""
+    try:
+        module_name, attribute = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attribute)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -4,10 +4,17 @@ Enhanced SDBS Parser with Real Web Integration
 Provides parsing functionality for SDBS data with both demo and real web scraping capabilities.
 """
 
+import copy
 import sys
 import os
-from typing import List, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from types import MappingProxyType
+from typing import Iterable, Iterator, List, Dict, Mapping, Optional, Tuple
 import re
+import numpy as np
 
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -16,6 +23,266 @@ from nmr_simulator import Molecule, Spectrum, Peak
 from nmr_simulator.molecule import Atom
 from .enhanced_scraper import SDBSScraper
 
+# Optional JIT for the per-peak numeric transform
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True)
+    def _compute_peak_numerics(integrations):
+        """Return the normalized intensities for one spectrum's peak integrations."""
+        intensities = np.empty_like(integrations)
+        for k in range(integrations.shape[0]):
+            intensities[k] = integrations[k] * 0.8 + 0.2
+        return intensities
+else:
+    def _compute_peak_numerics(integrations):
+        """Return the normalized intensities for one spectrum's peak integrations."""
+        return integrations * 0.8 + 0.2
+
+# Display PPM ranges, shared by every spectrum built for the nucleus
+_PPM_1H = (12.0, 0.0)
+_PPM_13C = (220.0, 0.0)
+_PPM_DEFAULT = (15.0, 0.0)
+
+# Display PPM range and typical peak width per nucleus
+_NUCLEUS_DEFAULTS = {
+    "1H": (_PPM_1H, 0.02),
+    "13C": (_PPM_13C, 0.5)
+}
+_DEFAULT_NUCLEUS = (_PPM_DEFAULT, 0.5)
+
+
+@dataclass(frozen=True, slots=True)
+class _PeakRec:
+    """Immutable peak record used by the built-in demo and solvent tables."""
+    shift: float
+    multiplicity: str = "s"
+    integration: float = 1.0
+    coupling: Tuple[float, ...] = ()
+    is_solvent: bool = False
+
+
+# Peak record fields read when building a spectrum, and the values used for missing dict keys
+_PEAK_FIELD_DEFAULTS = MappingProxyType({
+    "shift": 0.0,
+    "multiplicity": "s",
+    "integration": 1.0,
+    "coupling": (),
+    "is_solvent": False
+})
+_PEAK_FIELDS_GETTER = itemgetter(*_PEAK_FIELD_DEFAULTS)
+_PEAK_REC_GETTER = attrgetter(*_PEAK_FIELD_DEFAULTS)
+
+
+def _peak_fields(peak_info) -> Tuple:
+    """(shift, multiplicity, integration, coupling, is_solvent) of a _PeakRec or peak dict, with defaults."""
+    if type(peak_info) is _PeakRec:
+        return _PEAK_REC_GETTER(peak_info)
+    try:
+        return _PEAK_FIELDS_GETTER(peak_info)
+    except KeyError:  # Incomplete record (e.g. from the scraper); fill in the defaults
+        return _PEAK_FIELDS_GETTER({**_PEAK_FIELD_DEFAULTS, **peak_info})
+
+
+def _freeze_peak_table(table: Dict[str, Dict[str, List[Dict]]]) -> Mapping[str, Mapping[str, Tuple[_PeakRec, ...]]]:
+    """Freeze a {name: {nucleus: [peak dict, ...]}} table into read-only mappings of _PeakRec tuples."""
+    return MappingProxyType({
+        name: MappingProxyType({
+            nucleus: tuple(
+                _PeakRec(**{key: tuple(value) if isinstance(value, list) else value
+                            for key, value in peak.items()})
+                for peak in peaks
+            )
+            for nucleus, peaks in nuclei.items()
+        })
+        for name, nuclei in table.items()
+    })
+
+
+# Solvent signals for common NMR solvents
+_SOLVENT_SIGNALS = _freeze_peak_table({
+    "CDCl3": {
+        "1H": [{"shift": 7.26, "multiplicity": "s", "integration": 0.2, "coupling": [], "is_solvent": True}],
+        "13C": [{"shift": 77.16, "multiplicity": "t", "integration": 0.3, "coupling": [32.0], "is_solvent": True}]
+    },
+    "DMSO-d6": {
+        "1H": [{"shift": 2.50, "multiplicity": "quint", "integration": 0.1, "coupling": [1.9], "is_solvent": True}],
+        "13C": [{"shift": 39.52, "multiplicity": "sept", "integration": 0.2, "coupling": [1.3], "is_solvent": True}]
+    },
+    "D2O": {
+        "1H": [{"shift": 4.79, "multiplicity": "s", "integration": 0.5, "coupling": [], "is_solvent": True}],
+        "13C": []
+    },
+    "CD3OD": {
+        "1H": [
+            {"shift": 3.31, "multiplicity": "quint", "integration": 0.1, "coupling": [1.1], "is_solvent": True},
+            {"shift": 4.87, "multiplicity": "s", "integration": 0.3, "coupling": [], "is_solvent": True}  # HOD
+        ],
+        "13C": [{"shift": 49.00, "multiplicity": "sept", "integration": 0.2, "coupling": [21.4], "is_solvent": True}]
+    }
+})
+
+# Demo 1H/13C peak lists per compound (lowercase name)
+_DEMO_DATA = _freeze_peak_table({
+    "ethanol": {
+        "1H": [
+            {"shift": 1.25, "multiplicity": "t", "integration": 3, "coupling": [7.0]},   # CH3
+            {"shift": 3.70, "multiplicity": "q", "integration": 2, "coupling": [7.0]},   # OCH2
+            {"shift": 2.61, "multiplicity": "s", "integration": 1, "coupling": []}       # OH (broad)
+        ],
+        "13C": [
+            {"shift": 18.1, "multiplicity": "s", "integration": 1},  # CH3
+            {"shift": 58.4, "multiplicity": "s", "integration": 1}   # OCH2
+        ]
+    },
+    "acetone": {
+        "1H": [
+            {"shift": 2.17, "multiplicity": "s", "integration": 6, "coupling": []}
+        ],
+        "13C": [
+            {"shift": 29.8, "multiplicity": "s", "integration": 2},
+            {"shift": 207.1, "multiplicity": "s", "integration": 1}
+        ]
+    },
+    "benzene": {
+        "1H": [
+            {"shift": 7.36, "multiplicity": "s", "integration": 6, "coupling": []}
+        ],
+        "13C": [
+            {"shift": 128.4, "multiplicity": "s", "integration": 6}
+        ]
+    },
+    "methanol": {
+        "1H": [
+            {"shift": 3.34, "multiplicity": "s", "integration": 3, "coupling": []},
+            {"shift": 4.87, "multiplicity": "s", "integration": 1, "coupling": []}
+        ],
+        "13C": [
+            {"shift": 49.0, "multiplicity": "s", "integration": 1}
+        ]
+    },
+    "toluene": {
+        "1H": [
+            {"shift": 2.34, "multiplicity": "s", "integration": 3, "coupling": []},
+            {"shift": 7.17, "multiplicity": "m", "integration": 2, "coupling": []},
+            {"shift": 7.26, "multiplicity": "m", "integration": 3, "coupling": []}
+        ],
+        "13C": [
+            {"shift": 21.4, "multiplicity": "s", "integration": 1},
+            {"shift": 125.3, "multiplicity": "s", "integration": 1},
+            {"shift": 128.1, "multiplicity": "s", "integration": 2},
+            {"shift": 129.2, "multiplicity": "s", "integration": 2},
+            {"shift": 137.7, "multiplicity": "s", "integration": 1}
+        ]
+    },
+    "indole": {
+        "1H": [
+            {"shift": 6.52, "multiplicity": "m", "integration": 1, "coupling": []},  # H-3
+            {"shift": 7.08, "multiplicity": "t", "integration": 1, "coupling": [7.8]},  # H-5
+            {"shift": 7.16, "multiplicity": "t", "integration": 1, "coupling": [7.8]},  # H-6
+            {"shift": 7.21, "multiplicity": "d", "integration": 1, "coupling": [3.0]},  # H-2
+            {"shift": 7.38, "multiplicity": "d", "integration": 1, "coupling": [8.1]},  # H-7
+            {"shift": 7.64, "multiplicity": "d", "integration": 1, "coupling": [7.8]},  # H-4
+            {"shift": 8.14, "multiplicity": "s", "integration": 1, "coupling": []}   # NH
+        ],
+        "13C": [
+            {"shift": 102.1, "multiplicity": "s", "integration": 1},  # C-3
+            {"shift": 111.2, "multiplicity": "s", "integration": 1},  # C-7
+            {"shift": 119.7, "multiplicity": "s", "integration": 1},  # C-4
+            {"shift": 120.9, "multiplicity": "s", "integration": 1},  # C-5
+            {"shift": 122.1, "multiplicity": "s", "integration": 1},  # C-6
+            {"shift": 124.3, "multiplicity": "s", "integration": 1},  # C-2
+            {"shift": 127.9, "multiplicity": "s", "integration": 1},  # C-3a
+            {"shift": 136.1, "multiplicity": "s", "integration": 1}   # C-7a
+        ]
+    },
+    "pyridine": {
+        "1H": [
+            {"shift": 7.23, "multiplicity": "t", "integration": 2, "coupling": [7.7]}, # H-3,5
+            {"shift": 7.67, "multiplicity": "t", "integration": 1, "coupling": [7.7]}, # H-4
+            {"shift": 8.60, "multiplicity": "d", "integration": 2, "coupling": [4.8]}  # H-2,6
+        ],
+        "13C": [
+            {"shift": 123.8, "multiplicity": "s", "integration": 2}, # C-3,5
+            {"shift": 135.9, "multiplicity": "s", "integration": 1}, # C-4
+            {"shift": 149.9, "multiplicity": "s", "integration": 2}  # C-2,6
+        ]
+    },
+    "phenol": {
+        "1H": [
+            {"shift": 4.73, "multiplicity": "s", "integration": 1, "coupling": []},   # OH
+            {"shift": 6.78, "multiplicity": "d", "integration": 2, "coupling": [8.8]}, # H-2,6
+            {"shift": 6.93, "multiplicity": "t", "integration": 1, "coupling": [7.3]}, # H-4
+            {"shift": 7.20, "multiplicity": "t", "integration": 2, "coupling": [7.8]}  # H-3,5
+        ],
+        "13C": [
+            {"shift": 115.6, "multiplicity": "s", "integration": 2}, # C-2,6
+            {"shift": 120.8, "multiplicity": "s", "integration": 1}, # C-4
+            {"shift": 129.5, "multiplicity": "s", "integration": 2}, # C-3,5
+            {"shift": 155.3, "multiplicity": "s", "integration": 1}  # C-1
+        ]
+    }
+})
+
+_NO_SOLVENT_SIGNALS: Mapping[str, Tuple[_PeakRec, ...]] = MappingProxyType({})
+
+
+def _build_peaks(peak_data: Iterable, width: float) -> List[Peak]:
+    """Build Peak objects (intensity normalized from integration) from peak dicts or _PeakRec records."""
+    # One pass over the input (any iterable), one itemgetter call per peak
+    rows = list(map(_peak_fields, peak_data))
+    if not rows:
+        return []
+    
+    # Split the peak records into columns
+    shift_col, multiplicities, integration_col, couplings, solvent_flags = zip(*rows)
+    
+    # Numeric columns as arrays; intensities come from one kernel call
+    shifts = np.array(shift_col, dtype=np.float64)
+    integrations = np.array(integration_col, dtype=np.float64)
+    intensities = _compute_peak_numerics(integrations)
+    
+    return [
+        Peak(
+            chemical_shift=chemical_shift,
+            intensity=intensity,
+            width=width,
+            multiplicity=multiplicity,
+            integration=integration,
+            coupling_constants=list(coupling_constants) if coupling_constants else [],
+            is_solvent=is_solvent
+        )
+        for chemical_shift, multiplicity, integration, intensity, coupling_constants, is_solvent in zip(
+            shifts.tolist(), multiplicities, integrations.tolist(), intensities.tolist(), couplings, solvent_flags)
+    ]
+
+
+@lru_cache(maxsize=None)
+def _solvent_peak_templates(solvent: str, nucleus: str) -> Tuple[Peak, ...]:
+    """Solvent Peak objects for one (solvent, nucleus), built once and cloned into each spectrum."""
+    signals = _SOLVENT_SIGNALS.get(solvent, _NO_SOLVENT_SIGNALS).get(nucleus, ())
+    return tuple(_build_peaks(signals, _NUCLEUS_DEFAULTS.get(nucleus, _DEFAULT_NUCLEUS)[1]))
+
+
+def _clone_peaks(templates: Tuple[Peak, ...]) -> List[Peak]:
+    """Shallow copies of template peaks, each with its own coupling constant list."""
+    clones = []
+    for template in templates:
+        clone = copy.copy(template)
+        clone.coupling_constants = list(template.coupling_constants)
+        clones.append(clone)
+    return clones
+
+
+@lru_cache(maxsize=256)
+def _normalize_compound_key(name: str) -> str:
+    """Demo table key for a compound name (lowercase, surrounding whitespace removed)."""
+    return name.lower().strip()
+
 
 class EnhancedSDBSParser:
     """
@@ -38,6 +305,9 @@ class EnhancedSDBSParser:
             'dd': 'doublet of doublets',
             'dt': 'doublet of triplets'
         }
+        
+        # Formatted exports keyed by (format, spectrum snapshot); cleared when it grows too large
+        self._export_cache: Dict[Tuple, str] = {}
     
     def search_compounds(self, compound_name: str, max_results: int = 10) -> List[Dict]:
         """
@@ -70,6 +340,20 @@ class EnhancedSDBSParser:
             print(f"Error retrieving SDBS ID {sdbs_id}: {e}")
             return None, []
     
+    def retrieve_by_ids(self, sdbs_ids: List[str], max_workers: int = 8) -> List[Tuple[Optional[Molecule], List[Spectrum]]]:
+        """
+        Retrieve several SDBS entries concurrently.
+        
+        Args:
+            sdbs_ids: SDBS database IDs
+            max_workers: Maximum number of concurrent retrievals
+            
+        Returns:
+            List of (Molecule, List of Spectrum objects) tuples, in input order
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.retrieve_by_id, sdbs_ids))
+    
     def parse_compound_from_sdbs(self, compound_id: str, compound_name: str = "") -> Tuple[Molecule, List[Spectrum]]:
         """
         Parse compound data from SDBS and create Molecule and Spectrum objects.
@@ -90,7 +374,6 @@ class EnhancedSDBSParser:
         molecule.name = molecule_name
         
         # Add dummy atoms (in real implementation, would parse structure)
-        from nmr_simulator.molecule import Atom
         molecule.add_atom(Atom(element="C", position=1))
         molecule.add_atom(Atom(element="H", position=1))
         
@@ -109,25 +392,20 @@ class EnhancedSDBSParser:
         
         return molecule, spectra
     
-    def _create_spectrum_from_data(self, peak_data: List[Dict], nucleus: str, compound_name: str = "") -> Spectrum:
+    def _create_spectrum_from_data(self, peak_data: Iterable, nucleus: str, compound_name: str = "") -> Spectrum:
         """
         Create a Spectrum object from parsed peak data.
         
         Args:
-            peak_data: List of peak dictionaries
+            peak_data: Iterable of peak dictionaries or _PeakRec records (consumed once)
             nucleus: Nucleus type ('1H' or '13C')
             compound_name: Name of the compound
             
         Returns:
             Spectrum object
         """
-        # Set appropriate PPM range based on nucleus
-        if nucleus == "1H":
-            ppm_range = (12.0, 0.0)
-        elif nucleus == "13C":
-            ppm_range = (220.0, 0.0)
-        else:
-            ppm_range = (15.0, 0.0)
+        # Set appropriate PPM range and typical peak width based on nucleus
+        ppm_range, width = _NUCLEUS_DEFAULTS.get(nucleus, _DEFAULT_NUCLEUS)
         
         spectrum = Spectrum(
             nucleus=nucleus,
@@ -140,29 +418,7 @@ class EnhancedSDBSParser:
         # Set title
         spectrum.title = f"{nucleus} NMR Spectrum - {compound_name}" if compound_name else f"{nucleus} NMR Spectrum"
         
-        # Add peaks to spectrum
-        for peak_info in peak_data:
-            chemical_shift = peak_info.get("shift", 0.0)
-            multiplicity = peak_info.get("multiplicity", "s")
-            integration = peak_info.get("integration", 1.0)
-            coupling_constants = peak_info.get("coupling", [])
-            is_solvent = peak_info.get("is_solvent", False)
-            
-            # Create peak with realistic intensity and width
-            intensity = float(integration) * 0.8 + 0.2  # Normalize intensity
-            width = 0.02 if nucleus == "1H" else 0.5  # Typical peak widths
-            
-            peak = Peak(
-                chemical_shift=float(chemical_shift),
-                intensity=intensity,
-                width=width,
-                multiplicity=multiplicity,
-                integration=float(integration),
-                coupling_constants=coupling_constants if coupling_constants else [],
-                is_solvent=is_solvent
-            )
-            
-            spectrum.add_peak(peak)
+        spectrum.add_peaks(_build_peaks(peak_data, width))
         
         return spectrum
     
@@ -177,140 +433,15 @@ class EnhancedSDBSParser:
         Returns:
             Tuple of (Molecule, List of Spectrum objects)
         """
-        # Define solvent signals for common NMR solvents
-        solvent_signals = {
-            "CDCl3": {
-                "1H": [{"shift": 7.26, "multiplicity": "s", "integration": 0.2, "coupling": [], "is_solvent": True}],
-                "13C": [{"shift": 77.16, "multiplicity": "t", "integration": 0.3, "coupling": [32.0], "is_solvent": True}]
-            },
-            "DMSO-d6": {
-                "1H": [{"shift": 2.50, "multiplicity": "quint", "integration": 0.1, "coupling": [1.9], "is_solvent": True}],
-                "13C": [{"shift": 39.52, "multiplicity": "sept", "integration": 0.2, "coupling": [1.3], "is_solvent": True}]
-            },
-            "D2O": {
-                "1H": [{"shift": 4.79, "multiplicity": "s", "integration": 0.5, "coupling": [], "is_solvent": True}],
-                "13C": []
-            },
-            "CD3OD": {
-                "1H": [
-                    {"shift": 3.31, "multiplicity": "quint", "integration": 0.1, "coupling": [1.1], "is_solvent": True},
-                    {"shift": 4.87, "multiplicity": "s", "integration": 0.3, "coupling": [], "is_solvent": True}  # HOD
-                ],
-                "13C": [{"shift": 49.00, "multiplicity": "sept", "integration": 0.2, "coupling": [21.4], "is_solvent": True}]
-            }
-        }
-        
-        demo_data = {
-            "ethanol": {
-                "1H": [
-                    {"shift": 1.25, "multiplicity": "t", "integration": 3, "coupling": [7.0]},   # CH3
-                    {"shift": 3.70, "multiplicity": "q", "integration": 2, "coupling": [7.0]},   # OCH2
-                    {"shift": 2.61, "multiplicity": "s", "integration": 1, "coupling": []}       # OH (broad)
-                ],
-                "13C": [
-                    {"shift": 18.1, "multiplicity": "s", "integration": 1},  # CH3
-                    {"shift": 58.4, "multiplicity": "s", "integration": 1}   # OCH2
-                ]
-            },
-            "acetone": {
-                "1H": [
-                    {"shift": 2.17, "multiplicity": "s", "integration": 6, "coupling": []}
-                ],
-                "13C": [
-                    {"shift": 29.8, "multiplicity": "s", "integration": 2},
-                    {"shift": 207.1, "multiplicity": "s", "integration": 1}
-                ]
-            },
-            "benzene": {
-                "1H": [
-                    {"shift": 7.36, "multiplicity": "s", "integration": 6, "coupling": []}
-                ],
-                "13C": [
-                    {"shift": 128.4, "multiplicity": "s", "integration": 6}
-                ]
-            },
-            "methanol": {
-                "1H": [
-                    {"shift": 3.34, "multiplicity": "s", "integration": 3, "coupling": []},
-                    {"shift": 4.87, "multiplicity": "s", "integration": 1, "coupling": []}
-                ],
-                "13C": [
-                    {"shift": 49.0, "multiplicity": "s", "integration": 1}
-                ]
-            },
-            "toluene": {
-                "1H": [
-                    {"shift": 2.34, "multiplicity": "s", "integration": 3, "coupling": []},
-                    {"shift": 7.17, "multiplicity": "m", "integration": 2, "coupling": []},
-                    {"shift": 7.26, "multiplicity": "m", "integration": 3, "coupling": []}
-                ],
-                "13C": [
-                    {"shift": 21.4, "multiplicity": "s", "integration": 1},
-                    {"shift": 125.3, "multiplicity": "s", "integration": 1},
-                    {"shift": 128.1, "multiplicity": "s", "integration": 2},
-                    {"shift": 129.2, "multiplicity": "s", "integration": 2},
-                    {"shift": 137.7, "multiplicity": "s", "integration": 1}
-                ]
-            },
-            "indole": {
-                "1H": [
-                    {"shift": 6.52, "multiplicity": "m", "integration": 1, "coupling": []},  # H-3
-                    {"shift": 7.08, "multiplicity": "t", "integration": 1, "coupling": [7.8]},  # H-5
-                    {"shift": 7.16, "multiplicity": "t", "integration": 1, "coupling": [7.8]},  # H-6
-                    {"shift": 7.21, "multiplicity": "d", "integration": 1, "coupling": [3.0]},  # H-2
-                    {"shift": 7.38, "multiplicity": "d", "integration": 1, "coupling": [8.1]},  # H-7
-                    {"shift": 7.64, "multiplicity": "d", "integration": 1, "coupling": [7.8]},  # H-4
-                    {"shift": 8.14, "multiplicity": "s", "integration": 1, "coupling": []}   # NH
-                ],
-                "13C": [
-                    {"shift": 102.1, "multiplicity": "s", "integration": 1},  # C-3
-                    {"shift": 111.2, "multiplicity": "s", "integration": 1},  # C-7
-                    {"shift": 119.7, "multiplicity": "s", "integration": 1},  # C-4
-                    {"shift": 120.9, "multiplicity": "s", "integration": 1},  # C-5
-                    {"shift": 122.1, "multiplicity": "s", "integration": 1},  # C-6
-                    {"shift": 124.3, "multiplicity": "s", "integration": 1},  # C-2
-                    {"shift": 127.9, "multiplicity": "s", "integration": 1},  # C-3a
-                    {"shift": 136.1, "multiplicity": "s", "integration": 1}   # C-7a
-                ]
-            },
-            "pyridine": {
-                "1H": [
-                    {"shift": 7.23, "multiplicity": "t", "integration": 2, "coupling": [7.7]}, # H-3,5
-                    {"shift": 7.67, "multiplicity": "t", "integration": 1, "coupling": [7.7]}, # H-4
-                    {"shift": 8.60, "multiplicity": "d", "integration": 2, "coupling": [4.8]}  # H-2,6
-                ],
-                "13C": [
-                    {"shift": 123.8, "multiplicity": "s", "integration": 2}, # C-3,5
-                    {"shift": 135.9, "multiplicity": "s", "integration": 1}, # C-4
-                    {"shift": 149.9, "multiplicity": "s", "integration": 2}  # C-2,6
-                ]
-            },
-            "phenol": {
-                "1H": [
-                    {"shift": 4.73, "multiplicity": "s", "integration": 1, "coupling": []},   # OH
-                    {"shift": 6.78, "multiplicity": "d", "integration": 2, "coupling": [8.8]}, # H-2,6
-                    {"shift": 6.93, "multiplicity": "t", "integration": 1, "coupling": [7.3]}, # H-4
-                    {"shift": 7.20, "multiplicity": "t", "integration": 2, "coupling": [7.8]}  # H-3,5
-                ],
-                "13C": [
-                    {"shift": 115.6, "multiplicity": "s", "integration": 2}, # C-2,6
-                    {"shift": 120.8, "multiplicity": "s", "integration": 1}, # C-4
-                    {"shift": 129.5, "multiplicity": "s", "integration": 2}, # C-3,5
-                    {"shift": 155.3, "multiplicity": "s", "integration": 1}  # C-1
-                ]
-            }
-        }
-        
         # Get data for the compound
-        compound_key = compound_name.lower().strip()
-        nmr_data = demo_data.get(compound_key, demo_data["ethanol"])  # Default to ethanol
+        compound_key = _normalize_compound_key(compound_name)
+        nmr_data = _DEMO_DATA.get(compound_key, _DEMO_DATA["ethanol"])  # Default to ethanol
         
         # Create molecule
         molecule = Molecule(identifier=compound_name, molecule_type="name")
         molecule.name = compound_name
         
         # Add some basic atoms (simplified for demo purposes)
-        from nmr_simulator.molecule import Atom
         molecule.add_atom(Atom(element="C", position=1))
         molecule.add_atom(Atom(element="H", position=1))
         
@@ -318,26 +449,16 @@ class EnhancedSDBSParser:
         spectra = []
         
         if "1H" in nmr_data:
-            # Get compound peaks
-            compound_peaks = nmr_data["1H"].copy()
-            
-            # Add solvent signals if available
-            if solvent in solvent_signals and "1H" in solvent_signals[solvent]:
-                compound_peaks.extend(solvent_signals[solvent]["1H"])
-            
-            h_spectrum = self._create_spectrum_from_data(compound_peaks, "1H", compound_name)
+            # Compound peaks, then copies of the prebuilt solvent signal peaks (if any)
+            h_spectrum = self._create_spectrum_from_data(nmr_data["1H"], "1H", compound_name)
+            h_spectrum.add_peaks(_clone_peaks(_solvent_peak_templates(solvent, "1H")))
             h_spectrum.solvent = solvent
             spectra.append(h_spectrum)
         
         if "13C" in nmr_data:
-            # Get compound peaks
-            compound_peaks = nmr_data["13C"].copy()
-            
-            # Add solvent signals if available
-            if solvent in solvent_signals and "13C" in solvent_signals[solvent]:
-                compound_peaks.extend(solvent_signals[solvent]["13C"])
-            
-            c_spectrum = self._create_spectrum_from_data(compound_peaks, "13C", compound_name)
+            # Compound peaks, then copies of the prebuilt solvent signal peaks (if any)
+            c_spectrum = self._create_spectrum_from_data(nmr_data["13C"], "13C", compound_name)
+            c_spectrum.add_peaks(_clone_peaks(_solvent_peak_templates(solvent, "13C")))
             c_spectrum.solvent = solvent
             spectra.append(c_spectrum)
         
@@ -354,73 +475,118 @@ class EnhancedSDBSParser:
         Returns:
             Formatted string representation
         """
-        if format_type == "simple":
-            return self._export_simple_format(spectrum)
-        elif format_type == "detailed":
-            return self._export_detailed_format(spectrum)
+        cache_key = (format_type, self._export_snapshot(spectrum))
+        output = self._export_cache.get(cache_key)
+        if output is not None:
+            return output
+        
+        output = "".join(self._iter_format(spectrum, format_type))
+        
+        if len(self._export_cache) >= 32:
+            self._export_cache.clear()
+        self._export_cache[cache_key] = output
+        return output
+    
+    def export_to_file(self, spectrum: Spectrum, path: str, format_type: str = "simple") -> None:
+        """
+        Export spectrum data to a file, writing it line by line.
+        
+        Args:
+            spectrum: Spectrum object to export
+            path: Output file path
+            format_type: Type of format ('simple', 'detailed', 'jcamp')
+        """
+        with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            f.writelines(self._iter_format(spectrum, format_type))
+    
+    def _iter_format(self, spectrum: Spectrum, format_type: str) -> Iterator[str]:
+        """Lines (with newlines) of the requested export format; unknown formats use 'simple'."""
+        if format_type == "detailed":
+            return self._iter_detailed_format(spectrum)
         elif format_type == "jcamp":
-            return self._export_jcamp_format(spectrum)
+            return self._iter_jcamp_format(spectrum)
         else:
-            return self._export_simple_format(spectrum)
+            return self._iter_simple_format(spectrum)
+    
+    def _export_snapshot(self, spectrum: Spectrum) -> Tuple:
+        """
+        Hashable snapshot of everything the exports read from a spectrum and this parser.
+        
+        Peaks are edited in place (e.g. from the GUI peak editor), so a cached export is
+        matched on the exported values themselves rather than on spectrum identity. The
+        values are keyed by repr() because equal numbers can still render differently
+        (400 vs 400.0 MHz, 0.0 vs -0.0 ppm), and the instance multiplicity map is included
+        since it may be changed between exports.
+        """
+        return (
+            tuple(self.multiplicity_map.items()),
+            repr((
+                spectrum.nucleus,
+                spectrum.field_strength,
+                tuple(spectrum.ppm_range),
+                tuple(
+                    (peak.chemical_shift, peak.intensity, peak.width, peak.multiplicity,
+                     peak.integration, tuple(peak.coupling_constants or ()))
+                    for peak in spectrum.peaks
+                )
+            ))
+        )
     
-    def _export_simple_format(self, spectrum: Spectrum) -> str:
+    def _iter_simple_format(self, spectrum: Spectrum) -> Iterator[str]:
         """Export in simple text format."""
-        output = f"{spectrum.nucleus} NMR ({spectrum.field_strength} MHz):\n"
+        mult_map = self.multiplicity_map
+        yield f"{spectrum.nucleus} NMR ({spectrum.field_strength} MHz):\n"
         
-        for i, peak in enumerate(spectrum.peaks, 1):
-            mult_text = self.multiplicity_map.get(peak.multiplicity, peak.multiplicity)
+        for peak in spectrum.peaks:
+            mult_text = mult_map.get(peak.multiplicity, peak.multiplicity)
             
             if peak.coupling_constants:
                 coupling_text = f", J = {', '.join(f'{j:.1f}' for j in peak.coupling_constants)} Hz"
             else:
                 coupling_text = ""
             
-            output += f"δ {peak.chemical_shift:.2f} ({mult_text}, {peak.integration:.0f}H{coupling_text})\n"
-        
-        return output
+            yield f"δ {peak.chemical_shift:.2f} ({mult_text}, {peak.integration:.0f}H{coupling_text})\n"
     
-    def _export_detailed_format(self, spectrum: Spectrum) -> str:
+    def _iter_detailed_format(self, spectrum: Spectrum) -> Iterator[str]:
         """Export in detailed format with additional information."""
-        output = f"{spectrum.nucleus} NMR Spectrum\n"
-        output += "=" * 40 + "\n"
-        output += f"Field Strength: {spectrum.field_strength} MHz\n"
-        output += f"Number of Peaks: {len(spectrum.peaks)}\n"
-        output += f"PPM Range: {spectrum.ppm_range[0]:.1f} - {spectrum.ppm_range[1]:.1f}\n\n"
-        output += "Peak Analysis:\n"
-        output += "-" * 40 + "\n"
+        mult_map = self.multiplicity_map
+        yield (f"{spectrum.nucleus} NMR Spectrum\n"
+               + "=" * 40 + "\n"
+               f"Field Strength: {spectrum.field_strength} MHz\n"
+               f"Number of Peaks: {len(spectrum.peaks)}\n"
+               f"PPM Range: {spectrum.ppm_range[0]:.1f} - {spectrum.ppm_range[1]:.1f}\n\n"
+               "Peak Analysis:\n"
+               + "-" * 40 + "\n")
         
         for i, peak in enumerate(spectrum.peaks, 1):
-            mult_text = self.multiplicity_map.get(peak.multiplicity, peak.multiplicity)
+            mult_text = mult_map.get(peak.multiplicity, peak.multiplicity)
             
-            output += f"Peak {i}:\n"
-            output += f"  Chemical Shift: {peak.chemical_shift:.2f} ppm\n"
-            output += f"  Multiplicity: {mult_text} ({peak.multiplicity})\n"
-            output += f"  Integration: {peak.integration:.1f}H\n"
-            output += f"  Intensity: {peak.intensity:.3f}\n"
-            output += f"  Width: {peak.width:.3f} ppm\n"
+            yield (f"Peak {i}:\n"
+                   f"  Chemical Shift: {peak.chemical_shift:.2f} ppm\n"
+                   f"  Multiplicity: {mult_text} ({peak.multiplicity})\n"
+                   f"  Integration: {peak.integration:.1f}H\n"
+                   f"  Intensity: {peak.intensity:.3f}\n"
+                   f"  Width: {peak.width:.3f} ppm\n")
             
             if peak.coupling_constants:
-                output += f"  Coupling Constants: {', '.join(f'{j:.1f} Hz' for j in peak.coupling_constants)}\n"
+                yield f"  Coupling Constants: {', '.join(f'{j:.1f} Hz' for j in peak.coupling_constants)}\n"
             
-            output += "\n"
-        
-        return output
+            yield "\n"
     
-    def _export_jcamp_format(self, spectrum: Spectrum) -> str:
+    def _iter_jcamp_format(self, spectrum: Spectrum) -> Iterator[str]:
         """Export in simplified JCAMP-DX format."""
-        output = "##TITLE= NMR Spectrum\n"
-        output += "##JCAMP-DX= 5.00\n"
-        output += f"##DATA TYPE= {spectrum.nucleus} NMR SPECTRUM\n"
-        output += f"##OBSERVE FREQUENCY= {spectrum.field_strength}\n"
-        output += "##OBSERVE NUCLEUS= ^1H\n" if spectrum.nucleus == "1H" else "##OBSERVE NUCLEUS= ^13C\n"
-        output += "##UNITS= PPM\n"
-        output += "##PEAK TABLE= (XY..XY)\n"
-        
-        for peak in spectrum.peaks:
-            output += f"{peak.chemical_shift:.3f},{peak.intensity:.3f}\n"
-        
-        output += "##END=\n"
-        return output
+        yield ("##TITLE= NMR Spectrum\n"
+               "##JCAMP-DX= 5.00\n"
+               f"##DATA TYPE= {spectrum.nucleus} NMR SPECTRUM\n"
+               f"##OBSERVE FREQUENCY= {spectrum.field_strength}\n"
+               + ("##OBSERVE NUCLEUS= ^1H\n" if spectrum.nucleus == "1H" else "##OBSERVE NUCLEUS= ^13C\n")
+               + "##UNITS= PPM\n"
+               "##PEAK TABLE= (XY..XY)\n")
+        
+        # Peak table from the spectrum's column arrays, formatted pairwise without per-peak attribute access
+        shifts, intensities = spectrum.as_arrays()
+        yield from map("%.3f,%.3f\n".__mod__, zip(shifts.tolist(), intensities.tolist()))
+        yield "##END=\n"
     
     def test_connection(self) -> bool:
         """Test connection to SDBS website."""
@@ -5,46 +5,245 @@ Provides real web scraping functionality for the Spectral Database for Organic C
 Includes demo mode for testing and development.
 """
 
+import asyncio
+import copy
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree, html as lxml_html
 import re
+import shelve
+import threading
 import time
-from typing import List, Dict, Optional, Tuple
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
 import random
+from datetime import timedelta
+from pathlib import Path
 from urllib.parse import urljoin, quote
 
+# Optional persistent HTTP cache, so repeated scrapes are served from disk
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+# Version of the peak parsing below; bump it to invalidate persisted parse results
+_PARSER_VERSION = 1
+
+# Reused lxml HTML parsers, one per thread (a parser serializes the documents it parses).
+# SDBS serves UTF-8; declaring it keeps pages without a charset <meta> from being decoded
+# as Latin-1
+_PARSERS = threading.local()
+
+# Named, hidden and submit <input> fields of the ASP.NET disclaimer/search forms
+_NAMED_INPUTS_XPATH = etree.XPath('//input[@name]')
+_HIDDEN_INPUTS_XPATH = etree.XPath('//input[@type="hidden"]')
+_SUBMIT_INPUTS_XPATH = etree.XPath('//input[@type="submit"]')
+
+# Peak table rows with at least two cells, and the visible text nodes under a node
+# (script/style excluded, as with BeautifulSoup's get_text)
+_PEAK_ROW_XPATH = etree.XPath('//table//tr[count(td | th) >= 2]')
+# Cells of a search-result row, and the SDBS links inside a cell
+_ROW_CELLS_XPATH = etree.XPath('.//td | .//th')
+_SDBSNO_LINKS_XPATH = etree.XPath('.//a[contains(@href, "sdbsno=")]')
+_VISIBLE_TEXT_XPATH = etree.XPath('.//text()[not(ancestor::script or ancestor::style)]')
+_NMR_SECTIONS_XPATH = etree.XPath('//div[@class] | //table[@class]')
+_HREF_LINKS_XPATH = etree.XPath('//a[@href]')
+
+# Precompiled patterns for the SDBS pages, built once instead of per call/row
+_DISCLAIMER_ACCEPT_RE = re.compile(r'DisclaimeraAccept')
+_COMPANAME_RE = re.compile(r'companame')
+_SDBSNO_RE = re.compile(r'sdbsno=([^&]+)')
+_FORMULA_RE = re.compile(r'C\d+H\d+[A-Z]*\d*')
+_MW_RE = re.compile(r'(\d+\.?\d*)\s*g/mol')
+_NMR_HREF_RE = re.compile(r'nmr|NMR')
+_NMR_SECTION_CLASS_RE = re.compile(r'nmr|spectrum', re.I)
+
+# 1H assignments anywhere on a spectrum page: "δ 7.25 (s, 1H)", "7.25 ppm (s, 1H)", "7.25 (s, 1H)".
+# One pattern covers the table-cell and free-text forms, so the page is scanned once
+_H_PEAK_RE = re.compile(r'δ?\s*(\d+\.?\d*)\s*(?:ppm)?\s*\(([stdqm]+),?\s*(\d+\.?\d*)H?\)', re.I)
+# 13C "δ 128.5" shifts inside peak table rows
+_C_CELL_PEAK_RE = re.compile(r'δ?\s*(\d+\.?\d*)\s*(?:ppm)?')
+
+# "1H NMR ... " / "13C NMR ..." data embedded in a compound page's text
+_H_NMR_TEXT_RES = tuple(re.compile(pattern, re.I | re.DOTALL) for pattern in (
+    r'1H\s+NMR.*?δ\s*(\d+\.?\d*)\s*\(([stdqm]+),?\s*(\d+\.?\d*)H\)',
+    r'1H\s+NMR.*?(\d+\.?\d*)\s*ppm\s*\(([stdqm]+),?\s*(\d+\.?\d*)H\)'
+))
+_C_NMR_TEXT_RES = tuple(re.compile(pattern, re.I | re.DOTALL) for pattern in (
+    r'13C\s+NMR.*?δ\s*(\d+\.?\d*)',
+    r'13C\s+NMR.*?(\d+\.?\d*)\s*ppm'
+))
+
+# Loose 1H / 13C matches inside NMR-classed page sections
+_H_SECTION_PEAK_RE = re.compile(r'(\d+\.?\d*)\s*ppm.*?([stdqm])\s*.*?(\d+\.?\d*)H', re.I)
+_PPM_VALUE_RE = re.compile(r'(\d+\.?\d*)\s*ppm')
+
+
+@lru_cache(maxsize=8192)
+def _abs_url(href: str) -> str:
+    """Absolute URL for an href found on an SDBS page (site-relative, absolute or relative to cgi-bin)."""
+    if href.startswith('/'):
+        return f"https://sdbs.db.aist.go.jp{href}"
+    if href.startswith('http'):
+        return href
+    return f"https://sdbs.db.aist.go.jp/sdbs/cgi-bin/{href}"
+
+
+@lru_cache(maxsize=8192)
+def _compound_url(sdbs_id: str) -> str:
+    """URL of the SDBS compound page for an SDBS number."""
+    return f"https://sdbs.db.aist.go.jp/sdbs/cgi-bin/direct_frame_top.cgi?sdbsno={sdbs_id}"
+
+
+def _parse_html(content: bytes) -> lxml_html.HtmlElement:
+    """Parse an SDBS page with this thread's reusable lxml parser."""
+    parser = getattr(_PARSERS, 'html', None)
+    if parser is None:
+        parser = _PARSERS.html = lxml_html.HTMLParser(encoding='utf-8', remove_comments=True)
+    return lxml_html.fromstring(content, parser=parser)
+
+
+def _find_named_input(tree: lxml_html.HtmlElement, name_re: re.Pattern) -> Optional[lxml_html.HtmlElement]:
+    """First <input> whose name matches the pattern, or None."""
+    return next((field for field in _NAMED_INPUTS_XPATH(tree) if name_re.search(field.get('name'))), None)
+
+
+def _visible_text(element) -> str:
+    """Visible text under an lxml element, like BeautifulSoup's get_text()."""
+    return ''.join(_VISIBLE_TEXT_XPATH(element))
+
+
+def _link_text(link) -> str:
+    """Stripped text of an lxml anchor, joined like BeautifulSoup's get_text(strip=True)."""
+    return ''.join(text.strip() for text in link.itertext())
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+    
+    Tokens refill at ``rate`` per second up to ``burst``; each request takes one,
+    waiting for the next token when none are left.
+    """
+    
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Initialize the bucket (full).
+        
+        Args:
+            rate: Tokens added per second (sustained requests per second)
+            burst: Maximum number of tokens saved up for back-to-back requests
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Take one token, sleeping until one is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            
+            if self._tokens < 1:
+                time.sleep((1 - self._tokens) / self.rate)
+                self._tokens = 0.0
+                self._last = time.monotonic()
+            else:
+                self._tokens -= 1
+
+
+class _RateLimitedAdapter(HTTPAdapter):
+    """HTTP adapter that applies the scraper's rate limit to requests actually sent over the network."""
+    
+    def __init__(self, rate_limit, **kwargs):
+        self._rate_limit = rate_limit
+        super().__init__(**kwargs)
+    
+    def send(self, request, **kwargs):
+        self._rate_limit()
+        return super().send(request, **kwargs)
+
 
 class SDBSScraper:
     """
     Web scraper for SDBS database with real and demo capabilities.
     """
     
-    def __init__(self):
+    def __init__(self, use_cache: bool = True, parsed_cache_path: Optional[str] = None,
+                 parse_workers: int = 0):
         """
         Initialize the SDBS scraper for real web scraping.
+        
+        Args:
+            use_cache: Keep SDBS responses in a persistent on-disk cache (requires requests-cache)
+            parsed_cache_path: Optional shelve file persisting parsed NMR data across runs
+            parse_workers: Parse NMR spectrum pages in this many worker processes (0 parses
+                in the calling thread)
         """
         self.base_url = "https://sdbs.db.aist.go.jp"
         self.search_url = f"{self.base_url}/sdbs/cgi-bin/cre_index.cgi"
         
-        # Session for maintaining cookies
-        self.session = requests.Session()
+        # Session for maintaining cookies; with requests-cache installed, the compound and
+        # NMR page GETs are cached for 30 days. The disclaimer/search form steps depend on
+        # ASP.NET view-state tokens and the session cookie, so they always hit the network
+        if use_cache and REQUESTS_CACHE_AVAILABLE:
+            self.session = requests_cache.CachedSession(
+                'sdbs_cache',
+                backend='sqlite',
+                use_cache_dir=True,
+                expire_after=timedelta(days=30),
+                urls_expire_after={self.search_url: requests_cache.DO_NOT_CACHE},
+                allowable_methods=('GET',),
+                match_headers=False
+            )
+        else:
+            self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Connection': 'keep-alive'
         })
         
-        # Rate limiting
-        self.last_request_time = 0
-        self.min_delay = 2.0  # Minimum delay between requests in seconds
+        # Rate limiting (shared by all threads using this scraper): one request per min_delay
+        # on average, with short bursts allowed. It is applied by the transport adapter, so
+        # responses served from the cache never wait for it
+        self.min_delay = 2.0  # Average delay between requests in seconds
+        self.rate_limiter = TokenBucket(rate=1.0 / self.min_delay, burst=3)
+        
+        # Pooled keep-alive connections (enough for threaded/batch use, so TLS connections to
+        # SDBS are reused rather than re-established) with retries on transient server errors
+        adapter = _RateLimitedAdapter(
+            self._rate_limit,
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=1.0, status_forcelist=[500, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Parsed NMR data by compound ID, so repeat lookups skip fetching and parsing
+        self.parsed_cache_path = parsed_cache_path
+        self._nmr_cache: Dict[str, Dict] = {}
+        self._nmr_cache_lock = threading.Lock()
+        
+        # Save raw search result pages to the working directory for debugging
+        self.debug = False
+        
+        # Process pool for CPU-bound page parsing, started on first use
+        self.parse_workers = parse_workers
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        self._parse_pool_lock = threading.Lock()
     
     def _rate_limit(self):
         """Implement rate limiting to be respectful to the SDBS server."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        
-        if time_since_last < self.min_delay:
-            time.sleep(self.min_delay - time_since_last)
-        
-        self.last_request_time = time.time()
+        self.rate_limiter.acquire()
     
     def search_compounds(self, compound_name: str, max_results: int = 10) -> List[Dict]:
         """
@@ -59,183 +258,247 @@ class SDBSScraper:
         """
         return self._search_compounds_real(compound_name, max_results)
     
+    def search_many(self, compound_names: Iterable[str], max_results: int = 10,
+                    max_workers: int = 8) -> List[List[Dict]]:
+        """
+        Search for several compounds, accepting the SDBS disclaimer only once.
+        
+        The search form is read once and the searches are then submitted concurrently
+        over the shared session (still subject to the rate limit).
+        
+        Args:
+            compound_names: Names of the compounds to search for
+            max_results: Maximum number of results per compound
+            max_workers: Maximum number of concurrent searches
+            
+        Returns:
+            List of search results, in input order
+        """
+        compound_names = list(compound_names)
+        try:
+            search_form = self._get_search_form()
+        except Exception as e:
+            print(f"Error in real SDBS search: {e}")
+            return [[] for _ in compound_names]
+        
+        if search_form is None:
+            print("Could not find compound name search field")
+            return [[] for _ in compound_names]
+        
+        def search_one(compound_name: str) -> List[Dict]:
+            try:
+                return self._submit_search(search_form, compound_name, max_results)
+            except Exception as e:
+                print(f"Error in real SDBS search for '{compound_name}': {e}")
+                return []
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(search_one, compound_names))
+    
     def _search_compounds_real(self, compound_name: str, max_results: int) -> List[Dict]:
         """Real SDBS web search implementation."""
-        self._rate_limit()
-        
         try:
-            # SDBS requires accepting disclaimer first
-            disclaimer_url = "https://sdbs.db.aist.go.jp/sdbs/cgi-bin/cre_index.cgi"
-            
-            # Step 1: Get main page and accept disclaimer
             print(f"Accessing SDBS main page for '{compound_name}'...")
-            disclaimer_response = self.session.get(disclaimer_url, timeout=15)
-            disclaimer_response.raise_for_status()
-            
-            disclaimer_soup = BeautifulSoup(disclaimer_response.content, 'html.parser')
-            
-            # Look for disclaimer accept button
-            disclaimer_button = disclaimer_soup.find('input', {'name': re.compile(r'DisclaimeraAccept')})
-            
-            if disclaimer_button:
-                print("Found disclaimer button, accepting terms...")
-                
-                # Extract ASP.NET form data
-                form_data = {}
-                
-                # Get all hidden fields (ViewState, etc.)
-                for hidden_input in disclaimer_soup.find_all('input', {'type': 'hidden'}):
-                    name = hidden_input.get('name')
-                    value = hidden_input.get('value', '')
-                    if name:
-                        form_data[name] = value
-                
-                # Add the disclaimer acceptance button
-                form_data[disclaimer_button.get('name')] = disclaimer_button.get('value', 'Accept')
-                form_data['__EVENTTARGET'] = ''
-                form_data['__EVENTARGUMENT'] = ''
-                
-                # Submit disclaimer acceptance
-                self._rate_limit()
-                accept_response = self.session.post(disclaimer_url, data=form_data, timeout=15)
-                accept_response.raise_for_status()
-                
-                print("Disclaimer accepted, accessing search interface...")
-                disclaimer_soup = BeautifulSoup(accept_response.content, 'html.parser')
-            
-            # Step 2: Now perform the actual search
-            # Look for the compound name search field
-            company_name_field = disclaimer_soup.find('input', {'name': re.compile(r'companame')})
-            
-            if company_name_field:
-                field_name = company_name_field.get('name')
-                print(f"Found search field: {field_name}, searching for '{compound_name}'...")
-                
-                # Extract current form data
-                search_form_data = {}
-                for hidden_input in disclaimer_soup.find_all('input', {'type': 'hidden'}):
-                    name = hidden_input.get('name')
-                    value = hidden_input.get('value', '')
-                    if name:
-                        search_form_data[name] = value
-                
-                # Add search parameters
-                search_form_data[field_name] = compound_name
-                search_form_data['__EVENTTARGET'] = ''
-                search_form_data['__EVENTARGUMENT'] = ''
-                
-                # Look for search button
-                search_buttons = disclaimer_soup.find_all('input', {'type': 'submit'})
-                for button in search_buttons:
-                    button_value = button.get('value', '').lower()
-                    if 'search' in button_value or '検索' in button_value:
-                        search_form_data[button.get('name')] = button.get('value', '')
-                        break
-                
-                # Submit search
-                self._rate_limit()
-                search_response = self.session.post(disclaimer_url, data=search_form_data, timeout=15)
-                search_response.raise_for_status()
-                
-                print(f"Search submitted, response length: {len(search_response.text)} characters")
-                
-                # Save search result for debugging
-                with open(f'sdbs_search_{compound_name}_result.html', 'w', encoding='utf-8') as f:
-                    f.write(search_response.text)
-                print(f"Saved search result to sdbs_search_{compound_name}_result.html")
-                
-                # Parse the search results
-                search_soup = BeautifulSoup(search_response.content, 'html.parser')
-                results = self._parse_sdbs_search_results(search_soup)
-                
-                if results:
-                    print(f"Found {len(results)} real SDBS results for '{compound_name}'")
-                    return results[:max_results]
-                else:
-                    print(f"No real SDBS results found for '{compound_name}'")
-                    return []
+            search_form = self._get_search_form()
             
+            if search_form:
+                return self._submit_search(search_form, compound_name, max_results)
             else:
                 print("Could not find compound name search field")
                 return []
             
-        except Exception as e:
+        except requests.RequestException as e:
             print(f"Error in real SDBS search: {e}")
-            import traceback
-            traceback.print_exc()
             return []
+        except Exception as e:
+            print(f"Unexpected error in real SDBS search: {e}")
+            return []
+    
+    def _get_search_form(self) -> Optional[Tuple[Dict[str, str], str]]:
+        """
+        Accept the SDBS disclaimer and read the compound search form.
+        
+        Returns:
+            (form data template, name of the compound name field), or None if the
+            search field cannot be found
+        """
+        # SDBS requires accepting disclaimer first
+        # Step 1: Get main page and accept disclaimer
+        disclaimer_response = self.session.get(self.search_url, timeout=15)
+        disclaimer_response.raise_for_status()
+        
+        form_tree = _parse_html(disclaimer_response.content)
+        
+        # Look for disclaimer accept button
+        disclaimer_button = _find_named_input(form_tree, _DISCLAIMER_ACCEPT_RE)
+        
+        if disclaimer_button is not None:
+            print("Found disclaimer button, accepting terms...")
+            
+            # Extract ASP.NET form data
+            form_data = {}
+            
+            # Get all hidden fields (ViewState, etc.)
+            for hidden_input in _HIDDEN_INPUTS_XPATH(form_tree):
+                name = hidden_input.get('name')
+                value = hidden_input.get('value', '')
+                if name:
+                    form_data[name] = value
+            
+            # Add the disclaimer acceptance button
+            form_data[disclaimer_button.get('name')] = disclaimer_button.get('value', 'Accept')
+            form_data['__EVENTTARGET'] = ''
+            form_data['__EVENTARGUMENT'] = ''
+            
+            # Submit disclaimer acceptance
+            accept_response = self.session.post(self.search_url, data=form_data, timeout=15)
+            accept_response.raise_for_status()
+            
+            print("Disclaimer accepted, accessing search interface...")
+            form_tree = _parse_html(accept_response.content)
+        
+        # Step 2: Look for the compound name search field
+        company_name_field = _find_named_input(form_tree, _COMPANAME_RE)
+        
+        if company_name_field is None:
+            return None
+        
+        field_name = company_name_field.get('name')
+        print(f"Found search field: {field_name}")
+        
+        # Extract current form data
+        search_form_data = {}
+        for hidden_input in _HIDDEN_INPUTS_XPATH(form_tree):
+            name = hidden_input.get('name')
+            value = hidden_input.get('value', '')
+            if name:
+                search_form_data[name] = value
+        
+        # Add search parameters (the compound name is filled in per search)
+        search_form_data[field_name] = ''
+        search_form_data['__EVENTTARGET'] = ''
+        search_form_data['__EVENTARGUMENT'] = ''
+        
+        # Look for search button
+        search_buttons = _SUBMIT_INPUTS_XPATH(form_tree)
+        for button in search_buttons:
+            button_value = button.get('value', '').lower()
+            if 'search' in button_value or '検索' in button_value:
+                search_form_data[button.get('name')] = button.get('value', '')
+                break
+        
+        return search_form_data, field_name
     
-    def _parse_sdbs_search_results(self, soup: BeautifulSoup) -> List[Dict]:
-        """Parse SDBS search results from HTML."""
-        results = []
+    def _submit_search(self, search_form: Tuple[Dict[str, str], str], compound_name: str,
+                       max_results: int) -> List[Dict]:
+        """Submit one compound search using a form read by _get_search_form."""
+        form_template, field_name = search_form
+        search_form_data = dict(form_template)
+        search_form_data[field_name] = compound_name
+        print(f"Searching for '{compound_name}'...")
+        
+        # Submit search; the result page is streamed into the parser as it downloads
+        with self.session.post(self.search_url, data=search_form_data, timeout=15,
+                               stream=True) as search_response:
+            search_response.raise_for_status()
+            
+            print("Search submitted, reading results...")
+            
+            # Save search result for debugging (raw bytes, no decode/re-encode)
+            if self.debug:
+                Path(f'sdbs_search_{compound_name}_result.html').write_bytes(search_response.content)
+                print(f"Saved search result to sdbs_search_{compound_name}_result.html")
+            
+            # Parse the search results, stopping the download once max_results are found
+            results = list(islice(self._iter_sdbs_search_results(search_response), max_results))
+        
+        if results:
+            print(f"Found {len(results)} real SDBS results for '{compound_name}'")
+        else:
+            print(f"No real SDBS results found for '{compound_name}'")
+        return results
+    
+    def _iter_sdbs_search_results(self, response: requests.Response) -> Iterator[Dict]:
+        """Parse SDBS search results incrementally from a streamed response, yielding each compound as soon as it is read."""
+        parser = etree.HTMLPullParser(events=('end',), encoding='utf-8')
+        found = False
         
         try:
             # Look for compound links in SDBS format
-            # SDBS typically shows results as links with compound names and IDs
-            compound_links = soup.find_all('a', href=re.compile(r'direct_frame_top\.cgi\?sdbsno='))
-            
-            for link in compound_links:
-                try:
-                    # Extract SDBS number from URL
-                    href = link.get('href', '')
-                    sdbs_match = re.search(r'sdbsno=([^&]+)', href)
-                    
-                    if sdbs_match:
-                        sdbs_id = sdbs_match.group(1)
-                        compound_name = link.get_text(strip=True)
-                        
-                        # Try to find additional info in the same row/container
-                        parent = link.parent
-                        if parent:
-                            # Look for molecular formula and weight in nearby text
-                            parent_text = parent.get_text()
-                            
-                            # Extract molecular formula (pattern like C8H7N)
-                            formula_match = re.search(r'C\d+H\d+[A-Z]*\d*', parent_text)
-                            formula = formula_match.group() if formula_match else "Unknown"
-                            
-                            # Extract molecular weight
-                            mw_match = re.search(r'(\d+\.?\d*)\s*g/mol', parent_text)
-                            mw = float(mw_match.group(1)) if mw_match else 0
-                            
-                            results.append({
-                                'name': compound_name,
-                                'id': sdbs_id,
-                                'formula': formula,
-                                'mw': mw,
-                                'url': f"https://sdbs.db.aist.go.jp/sdbs/cgi-bin/direct_frame_top.cgi?sdbsno={sdbs_id}"
-                            })
-                
-                except Exception as e:
-                    continue  # Skip problematic entries
+            # SDBS typically shows results as links with compound names and IDs. A link is
+            # read once its parent element is complete, since the formula/weight follow it
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                parser.feed(chunk)
+                for result in self._read_compound_links(parser):
+                    found = True
+                    yield result
+            tree = parser.close()
+            for result in self._read_compound_links(parser):
+                found = True
+                yield result
             
             # If no results found with the above method, try alternative parsing
-            if not results:
-                # Look for table rows that might contain compound data
-                table_rows = soup.find_all('tr')
-                for row in table_rows:
-                    cells = row.find_all(['td', 'th'])
-                    if len(cells) >= 2:
-                        # Check if any cell contains an SDBS link
-                        for cell in cells:
-                            link = cell.find('a', href=re.compile(r'sdbsno='))
-                            if link:
-                                href = link.get('href', '')
-                                sdbs_match = re.search(r'sdbsno=([^&]+)', href)
-                                if sdbs_match:
-                                    results.append({
-                                        'name': link.get_text(strip=True),
-                                        'id': sdbs_match.group(1),
-                                        'formula': "Unknown",
-                                        'mw': 0,
-                                        'url': f"https://sdbs.db.aist.go.jp{href}" if href.startswith('/') else href
-                                    })
-                                    break
+            if not found:
+                yield from self._iter_table_search_results(tree)
         
         except Exception as e:
             print(f"Error parsing SDBS search results: {e}")
-        
-        return results
+    
+    def _iter_table_search_results(self, tree: etree._Element) -> Iterator[Dict]:
+        """Fallback search results: the first SDBS link in each table row."""
+        # Look for table rows that might contain compound data
+        for row in tree.iter('tr'):
+            cells = _ROW_CELLS_XPATH(row)
+            if len(cells) >= 2:
+                # Check if any cell contains an SDBS link
+                for cell in cells:
+                    links = _SDBSNO_LINKS_XPATH(cell)
+                    if links:
+                        link = links[0]
+                        href = link.get('href', '')
+                        sdbs_match = _SDBSNO_RE.search(href)
+                        if sdbs_match:
+                            yield {
+                                'name': _link_text(link),
+                                'id': sdbs_match.group(1),
+                                'formula': "Unknown",
+                                'mw': 0,
+                                'url': _abs_url(href)
+                            }
+                            break
+    
+    def _read_compound_links(self, parser: etree.HTMLPullParser) -> Iterator[Dict]:
+        """Search results for the compound links under each element the pull parser has completed."""
+        for _, parent in parser.read_events():
+            for link in parent.iterchildren('a'):
+                # Extract SDBS number from URL
+                href = link.get('href', '')
+                if 'direct_frame_top.cgi?sdbsno=' not in href:
+                    continue
+                sdbs_match = _SDBSNO_RE.search(href)
+                
+                if sdbs_match:
+                    sdbs_id = sdbs_match.group(1)
+                    compound_name = _link_text(link)
+                    
+                    # Look for molecular formula and weight in nearby text
+                    parent_text = _visible_text(parent)
+                    
+                    # Extract molecular formula (pattern like C8H7N)
+                    formula_match = _FORMULA_RE.search(parent_text)
+                    formula = formula_match.group() if formula_match else "Unknown"
+                    
+                    # Extract molecular weight
+                    mw_match = _MW_RE.search(parent_text)
+                    mw = float(mw_match.group(1)) if mw_match else 0
+                    
+                    yield {
+                        'name': compound_name,
+                        'id': sdbs_id,
+                        'formula': formula,
+                        'mw': mw,
+                        'url': _compound_url(sdbs_id)
+                    }
     
     def get_nmr_data(self, compound_id: str) -> Dict:
         """
@@ -247,21 +510,47 @@ class SDBSScraper:
         Returns:
             Dictionary with NMR data
         """
-        return self._get_nmr_data_real(compound_id)
+        nmr_data = self._load_parsed_nmr_data(compound_id)
+        if nmr_data is None:
+            nmr_data = self._get_nmr_data_real(compound_id)
+            # Only keep results with peaks; empty ones may come from a failed fetch
+            if nmr_data["1H"] or nmr_data["13C"]:
+                self._store_parsed_nmr_data(compound_id, nmr_data)
+        
+        # Callers get their own copy, the cached peaks must not be mutated
+        return copy.deepcopy(nmr_data)
+    
+    def _load_parsed_nmr_data(self, compound_id: str) -> Optional[Dict]:
+        """Cached parse result for a compound (memory first, then the shelve file), or None."""
+        with self._nmr_cache_lock:
+            nmr_data = self._nmr_cache.get(compound_id)
+            if nmr_data is None and self.parsed_cache_path:
+                with shelve.open(self.parsed_cache_path) as shelf:
+                    entry = shelf.get(compound_id)
+                if entry is not None and entry.get('parser_version') == _PARSER_VERSION:
+                    nmr_data = self._nmr_cache[compound_id] = entry['nmr_data']
+        return nmr_data
+    
+    def _store_parsed_nmr_data(self, compound_id: str, nmr_data: Dict):
+        """Remember a parse result in memory and, if configured, in the shelve file."""
+        nmr_data = copy.deepcopy(nmr_data)
+        with self._nmr_cache_lock:
+            self._nmr_cache[compound_id] = nmr_data
+            if self.parsed_cache_path:
+                with shelve.open(self.parsed_cache_path) as shelf:
+                    shelf[compound_id] = {'parser_version': _PARSER_VERSION, 'nmr_data': nmr_data}
     
     def _get_nmr_data_real(self, compound_id: str) -> Dict:
         """Real SDBS NMR data retrieval."""
-        self._rate_limit()
-        
         try:
             # Construct URL for compound data page
-            compound_url = f"https://sdbs.db.aist.go.jp/sdbs/cgi-bin/direct_frame_top.cgi?sdbsno={compound_id}"
+            compound_url = _compound_url(compound_id)
             
             response = self.session.get(compound_url, timeout=15)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            nmr_data = self._parse_real_nmr_data(soup, compound_id)
+            tree = _parse_html(response.content)
+            nmr_data = self._parse_real_nmr_data(tree, compound_id)
             
             return nmr_data if nmr_data else {"1H": [], "13C": []}
             
@@ -272,17 +561,18 @@ class SDBSScraper:
             print(f"Unexpected error retrieving NMR data: {e}")
             return {"1H": [], "13C": []}
     
-    def _parse_real_nmr_data(self, soup: BeautifulSoup, compound_id: str) -> Dict:
-        """Parse real NMR data from SDBS compound page."""
+    def _parse_real_nmr_data(self, tree: lxml_html.HtmlElement, compound_id: str) -> Dict:
+        """Parse real NMR data from a parsed (lxml) SDBS compound page."""
         nmr_data = {"1H": [], "13C": []}
         
         try:
             # Look for NMR data frames or links
-            nmr_links = soup.find_all('a', href=re.compile(r'nmr|NMR'))
+            nmr_links = [link for link in _HREF_LINKS_XPATH(tree) if _NMR_HREF_RE.search(link.get('href'))]
             
+            subpages = []
             for link in nmr_links:
                 href = link.get('href', '')
-                link_text = link.get_text().lower()
+                link_text = _visible_text(link).lower()
                 
                 # Check if this is a 1H or 13C NMR link
                 if '1h' in link_text or 'proton' in link_text:
@@ -292,33 +582,23 @@ class SDBSScraper:
                 else:
                     continue
                 
-                # Fetch the NMR spectrum page
-                if href.startswith('/'):
-                    nmr_url = f"https://sdbs.db.aist.go.jp{href}"
-                elif href.startswith('http'):
-                    nmr_url = href
-                else:
-                    nmr_url = f"https://sdbs.db.aist.go.jp/sdbs/cgi-bin/{href}"
-                
-                try:
-                    self._rate_limit()
-                    nmr_response = self.session.get(nmr_url, timeout=10)
-                    nmr_response.raise_for_status()
-                    
-                    nmr_soup = BeautifulSoup(nmr_response.content, 'html.parser')
-                    peaks = self._extract_peaks_from_nmr_page(nmr_soup, nucleus)
-                    
-                    if peaks:
-                        nmr_data[nucleus] = peaks
-                        
-                except Exception as e:
-                    print(f"Error fetching {nucleus} NMR data: {e}")
-                    continue
+                subpages.append((nucleus, _abs_url(href)))
+            
+            # Fetch the NMR spectrum pages concurrently (they are independent of each other)
+            if len(subpages) > 1:
+                with ThreadPoolExecutor(max_workers=min(len(subpages), 4)) as executor:
+                    subpage_peaks = list(executor.map(lambda subpage: self._fetch_nmr_subpage(*subpage), subpages))
+            else:
+                subpage_peaks = [self._fetch_nmr_subpage(*subpage) for subpage in subpages]
+            
+            for (nucleus, _), peaks in zip(subpages, subpage_peaks):
+                if peaks:
+                    nmr_data[nucleus] = peaks
             
             # If no NMR links found, try to parse data from the main page
             if not nmr_data["1H"] and not nmr_data["13C"]:
                 # Look for NMR data directly on the compound page
-                page_text = soup.get_text()
+                page_text = _visible_text(tree)
                 nmr_data = self._extract_nmr_from_text(page_text)
         
         except Exception as e:
@@ -326,76 +606,84 @@ class SDBSScraper:
         
         return nmr_data
     
-    def _extract_peaks_from_nmr_page(self, soup: BeautifulSoup, nucleus: str) -> List[Dict]:
-        """Extract peak data from an NMR spectrum page."""
+    def _fetch_nmr_subpage(self, nucleus: str, nmr_url: str) -> List[Dict]:
+        """Fetch one NMR spectrum page and extract its peaks (empty on failure)."""
+        try:
+            nmr_response = self.session.get(nmr_url, timeout=10)
+            nmr_response.raise_for_status()
+            
+            # Parse off-thread in the process pool when configured, so parsing runs on
+            # other cores while this thread's next download proceeds
+            if self.parse_workers > 0:
+                return self._get_parse_pool().submit(_parse_nmr_page, nmr_response.content, nucleus).result()
+            return _parse_nmr_page(nmr_response.content, nucleus)
+            
+        except Exception as e:
+            print(f"Error fetching {nucleus} NMR data: {e}")
+            return []
+    
+    def _get_parse_pool(self) -> ProcessPoolExecutor:
+        """The scraper's parse process pool, started on first use."""
+        with self._parse_pool_lock:
+            if self._parse_pool is None:
+                self._parse_pool = ProcessPoolExecutor(max_workers=self.parse_workers)
+            return self._parse_pool
+    
+    @staticmethod
+    def _extract_peaks_from_nmr_page(tree: lxml_html.HtmlElement, nucleus: str,
+                                     max_peaks: int = 64) -> List[Dict]:
+        """Extract up to max_peaks distinct peaks from a parsed (lxml) NMR spectrum page."""
         peaks = []
         
         try:
-            # Look for peak assignment tables or text
-            tables = soup.find_all('table')
-            
-            for table in tables:
-                rows = table.find_all('tr')
-                for row in rows:
-                    cells = row.find_all(['td', 'th'])
-                    if len(cells) >= 2:
-                        cell_text = ' '.join(cell.get_text() for cell in cells)
-                        
-                        # Look for chemical shift patterns
-                        if nucleus == '1H':
-                            # Pattern: δ 7.25 (s, 1H) or similar
-                            matches = re.findall(r'δ?\s*(\d+\.?\d*)\s*(?:ppm)?\s*\(([stdqm]+),?\s*(\d+\.?\d*)H?\)', cell_text, re.I)
-                            for match in matches:
-                                try:
-                                    peaks.append({
-                                        "shift": float(match[0]),
-                                        "multiplicity": match[1].lower(),
-                                        "integration": float(match[2]),
-                                        "coupling": []
-                                    })
-                                except ValueError:
-                                    continue
-                        
-                        elif nucleus == '13C':
-                            # Pattern: δ 128.5 or similar
-                            matches = re.findall(r'δ?\s*(\d+\.?\d*)\s*(?:ppm)?', cell_text)
-                            for match in matches:
-                                try:
-                                    shift = float(match)
-                                    if 0 <= shift <= 250:  # Reasonable 13C range
-                                        peaks.append({
-                                            "shift": shift,
-                                            "multiplicity": "s",
-                                            "integration": 1,
-                                            "coupling": []
-                                        })
-                                except ValueError:
-                                    continue
-            
-            # Also check text content for NMR assignments
-            page_text = soup.get_text()
             if nucleus == '1H':
-                # More flexible 1H pattern matching
-                h_patterns = [
-                    r'(\d+\.?\d*)\s*ppm\s*\(([stdqm]+),?\s*(\d+\.?\d*)H\)',
-                    r'δ\s*(\d+\.?\d*)\s*\(([stdqm]+),?\s*(\d+\.?\d*)H\)',
-                    r'(\d+\.?\d*)\s*\(([stdqm]+),?\s*(\d+\.?\d*)H\)'
-                ]
-                
-                for pattern in h_patterns:
-                    matches = re.findall(pattern, page_text, re.I)
+                # One sweep over the page text (table cells included, text nodes space-separated
+                # like the cells of a row); the same peak is often listed in a table and in
+                # the text, so each (shift, multiplicity, integration) is kept once
+                page_text = ' '.join(_VISIBLE_TEXT_XPATH(tree))
+                seen = set()
+                for match in _H_PEAK_RE.finditer(page_text):
+                    shift = float(match.group(1))
+                    if not 0 <= shift <= 15:  # Reasonable 1H range
+                        continue
+                    key = (shift, match.group(2).lower(), float(match.group(3)))
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    peaks.append({
+                        "shift": key[0],
+                        "multiplicity": key[1],
+                        "integration": key[2],
+                        "coupling": []
+                    })
+                    if len(peaks) >= max_peaks:
+                        return peaks
+            
+            elif nucleus == '13C':
+                # Look for peak tables: one XPath pass over all table rows. Shifts repeat
+                # across cells/rows, so each (rounded) shift is kept once
+                seen = set()
+                for row in _PEAK_ROW_XPATH(tree):
+                    # Whole row's text in one traversal, space-separated (like get_text(' '))
+                    cell_text = ' '.join(_VISIBLE_TEXT_XPATH(row))
+                    
+                    # Pattern: δ 128.5 or similar
+                    matches = _C_CELL_PEAK_RE.findall(cell_text)
                     for match in matches:
-                        try:
-                            shift = float(match[0])
-                            if 0 <= shift <= 15:  # Reasonable 1H range
-                                peaks.append({
-                                    "shift": shift,
-                                    "multiplicity": match[1].lower(),
-                                    "integration": float(match[2]),
-                                    "coupling": []
-                                })
-                        except ValueError:
-                            continue
+                        shift = float(match)
+                        if 0 <= shift <= 250:  # Reasonable 13C range
+                            key = round(shift, 3)
+                            if key in seen:
+                                continue
+                            seen.add(key)
+                            peaks.append({
+                                "shift": shift,
+                                "multiplicity": "s",
+                                "integration": 1,
+                                "coupling": []
+                            })
+                            if len(peaks) >= max_peaks:
+                                return peaks
             
         except Exception as e:
             print(f"Error extracting peaks from {nucleus} NMR page: {e}")
@@ -408,94 +696,81 @@ class SDBSScraper:
         
         try:
             # Look for 1H NMR patterns in text
-            h_patterns = [
-                r'1H\s+NMR.*?δ\s*(\d+\.?\d*)\s*\(([stdqm]+),?\s*(\d+\.?\d*)H\)',
-                r'1H\s+NMR.*?(\d+\.?\d*)\s*ppm\s*\(([stdqm]+),?\s*(\d+\.?\d*)H\)'
-            ]
-            
-            for pattern in h_patterns:
-                matches = re.findall(pattern, text, re.I | re.DOTALL)
+            for pattern in _H_NMR_TEXT_RES:
+                matches = pattern.findall(text)
                 for match in matches:
-                    try:
-                        nmr_data["1H"].append({
-                            "shift": float(match[0]),
-                            "multiplicity": match[1].lower(),
-                            "integration": float(match[2]),
-                            "coupling": []
-                        })
-                    except ValueError:
-                        continue
+                    nmr_data["1H"].append({
+                        "shift": float(match[0]),
+                        "multiplicity": match[1].lower(),
+                        "integration": float(match[2]),
+                        "coupling": []
+                    })
             
             # Look for 13C NMR patterns
-            c_patterns = [
-                r'13C\s+NMR.*?δ\s*(\d+\.?\d*)',
-                r'13C\s+NMR.*?(\d+\.?\d*)\s*ppm'
-            ]
-            
-            for pattern in c_patterns:
-                matches = re.findall(pattern, text, re.I | re.DOTALL)
+            for pattern in _C_NMR_TEXT_RES:
+                matches = pattern.findall(text)
                 for match in matches:
-                    try:
-                        shift = float(match)
-                        if 0 <= shift <= 250:
-                            nmr_data["13C"].append({
-                                "shift": shift,
-                                "multiplicity": "s",
-                                "integration": 1,
-                                "coupling": []
-                            })
-                    except ValueError:
-                        continue
+                    shift = float(match)
+                    if 0 <= shift <= 250:
+                        nmr_data["13C"].append({
+                            "shift": shift,
+                            "multiplicity": "s",
+                            "integration": 1,
+                            "coupling": []
+                        })
         
         except Exception as e:
             print(f"Error extracting NMR from text: {e}")
         
         return nmr_data
     
-    def _parse_nmr_data(self, soup: BeautifulSoup) -> Dict:
-        """Parse NMR data from SDBS HTML."""
+    def _parse_nmr_data(self, tree: lxml_html.HtmlElement) -> Dict:
+        """Parse NMR data from parsed (lxml) SDBS HTML."""
         nmr_data = {"1H": [], "13C": []}
         
         # Look for NMR data sections
         # This is a simplified parser - real SDBS parsing would be more complex
-        nmr_sections = soup.find_all(['div', 'table'], class_=re.compile(r'nmr|spectrum', re.I))
+        nmr_sections = (section for section in _NMR_SECTIONS_XPATH(tree)
+                        if _NMR_SECTION_CLASS_RE.search(section.get('class')))
         
         for section in nmr_sections:
-            text = section.get_text()
+            text = _visible_text(section)
             
             # Look for 1H NMR data
-            h_matches = re.findall(r'(\d+\.?\d*)\s*ppm.*?([stdqm])\s*.*?(\d+\.?\d*)H', text, re.I)
+            h_matches = _H_SECTION_PEAK_RE.findall(text)
             for match in h_matches:
-                try:
-                    shift = float(match[0])
-                    mult = match[1].lower()
-                    integration = float(match[2])
-                    
-                    nmr_data["1H"].append({
-                        "shift": shift,
-                        "multiplicity": mult,
-                        "integration": integration,
-                        "coupling": []  # Coupling constants would need additional parsing
-                    })
-                except ValueError:
-                    continue
+                shift = float(match[0])
+                mult = match[1].lower()
+                integration = float(match[2])
+                
+                nmr_data["1H"].append({
+                    "shift": shift,
+                    "multiplicity": mult,
+                    "integration": integration,
+                    "coupling": []  # Coupling constants would need additional parsing
+                })
             
             # Look for 13C NMR data
-            c_matches = re.findall(r'(\d+\.?\d*)\s*ppm', text)
+            c_matches = _PPM_VALUE_RE.findall(text)
             for match in c_matches:
-                try:
-                    shift = float(match)
-                    if 0 <= shift <= 250:  # Reasonable 13C range
-                        nmr_data["13C"].append({
-                            "shift": shift,
-                            "multiplicity": "s",
-                            "integration": 1
-                        })
-                except ValueError:
-                    continue
+                shift = float(match)
+                if 0 <= shift <= 250:  # Reasonable 13C range
+                    nmr_data["13C"].append({
+                        "shift": shift,
+                        "multiplicity": "s",
+                        "integration": 1
+                    })
         
         return nmr_data
     
+    def close(self):
+        """Shut down the parse process pool (if started) and close the HTTP session."""
+        with self._parse_pool_lock:
+            if self._parse_pool is not None:
+                self._parse_pool.shutdown()
+                self._parse_pool = None
+        self.session.close()
+    
     def test_connection(self) -> bool:
         """Test connection to SDBS website."""
         try:
@@ -503,3 +778,76 @@ class SDBSScraper:
             return response.status_code == 200
         except requests.RequestException:
             return False
+
+
+def _parse_nmr_page(content: bytes, nucleus: str) -> List[Dict]:
+    """Parse a raw NMR spectrum page into peaks (module-level so worker processes can run it)."""
+    return SDBSScraper._extract_peaks_from_nmr_page(_parse_html(content), nucleus)
+
+
+class AsyncSDBSScraper:
+    """
+    Asynchronous front end to SDBSScraper for batch scrapes.
+    
+    Each lookup runs the blocking scraper in a worker thread, so many compound
+    pages can be in flight at once while sharing one session (connection pool)
+    and one rate limiter. Use as ``async with AsyncSDBSScraper() as scraper:``.
+    """
+    
+    def __init__(self, max_concurrency: int = 4, parse_workers: int = 0):
+        """
+        Initialize the async scraper.
+        
+        Args:
+            max_concurrency: Maximum number of lookups in flight against SDBS
+            parse_workers: Worker processes for parsing NMR pages (see SDBSScraper)
+        """
+        self.max_concurrency = max_concurrency
+        self.parse_workers = parse_workers
+        self.scraper: Optional[SDBSScraper] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+    
+    async def __aenter__(self) -> "AsyncSDBSScraper":
+        self.scraper = SDBSScraper(parse_workers=self.parse_workers)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        self.scraper.close()
+    
+    async def search_compounds(self, compound_name: str, max_results: int = 10) -> List[Dict]:
+        """Search SDBS for a compound without blocking the event loop."""
+        async with self._semaphore:
+            return await asyncio.to_thread(self.scraper.search_compounds, compound_name, max_results)
+    
+    async def get_nmr_data(self, compound_id: str) -> Dict:
+        """Get NMR data for a compound without blocking the event loop."""
+        async with self._semaphore:
+            return await asyncio.to_thread(self.scraper.get_nmr_data, compound_id)
+    
+    async def batch_search(self, compound_names: Iterable[str], max_results: int = 10) -> List[List[Dict]]:
+        """
+        Search for several compounds concurrently.
+        
+        Args:
+            compound_names: Names of the compounds to search for
+            max_results: Maximum number of results per compound
+            
+        Returns:
+            List of search results, in input order
+        """
+        # One disclaimer round-trip for the whole batch, searches fanned out by the scraper
+        return await asyncio.to_thread(self.scraper.search_many, compound_names, max_results,
+                                       self.max_concurrency)
+    
+    async def batch_get_nmr_data(self, compound_ids: Iterable[str]) -> List[Dict]:
+        """
+        Get NMR data for several compounds concurrently.
+        
+        Args:
+            compound_ids: SDBS compound IDs
+            
+        Returns:
+            List of NMR data dictionaries, in input order
+        """
+        return await asyncio.gather(*(self.get_nmr_data(compound_id) for compound_id in compound_ids))
@@ -8,7 +8,9 @@ suitable for NMR simulation.
 import re
 import sys
 import os
+from types import MappingProxyType
 from typing import Dict, List, Optional, Tuple
+import numpy as np
 
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -16,6 +18,141 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from nmr_simulator.molecule import Molecule, Atom
 from nmr_simulator.spectrum import Spectrum, Peak
 
+# Optional linear-time regex engine (google-re2) for bulk SDBS imports
+try:
+    import re2 as _re_engine
+    RE2_AVAILABLE = True
+except ImportError:
+    _re_engine = re
+    RE2_AVAILABLE = False
+
+# Coupling constants in peak descriptions, e.g. "J = 7.2 Hz"; the inline (?i) flag
+# works the same under re and re2
+_J_COUPLING_RE = _re_engine.compile(r'(?i)J\s*=?\s*(\d+\.?\d*)\s*Hz?')
+
+# Plausible chemical-shift window (ppm) per nucleus; peaks outside it are flagged
+_SHIFT_LIMITS = MappingProxyType({
+    '1H': (-5.0, 20.0),
+    '13C': (-20.0, 250.0)
+})
+
+# Optional JIT for the chemical-shift validation scan
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True)
+    def _find_bad_shifts(shifts, lo, hi):
+        """Return the indices of shifts outside [lo, hi]."""
+        bad = np.empty(shifts.shape[0], dtype=np.int64)
+        count = 0
+        for k in range(shifts.shape[0]):
+            if shifts[k] < lo or shifts[k] > hi:
+                bad[count] = k
+                count += 1
+        return bad[:count]
+else:
+    def _find_bad_shifts(shifts, lo, hi):
+        """Return the indices of shifts outside [lo, hi]."""
+        return np.flatnonzero((shifts < lo) | (shifts > hi))
+
+# Demo SDBS data for common compounds, built once (read-only)
+_DEMO_COMPOUNDS = MappingProxyType({
+    'Ethanol': {
+        'h1_nmr': [
+            {
+                'chemical_shift': 1.25,
+                'description': 't, 3H, J = 7.2 Hz',
+                'multiplicity': 't',
+                'integration': 3.0
+            },
+            {
+                'chemical_shift': 3.69,
+                'description': 'q, 2H, J = 7.2 Hz',
+                'multiplicity': 'q',
+                'integration': 2.0
+            },
+            {
+                'chemical_shift': 5.32,
+                'description': 'br s, 1H',
+                'multiplicity': 's',
+                'integration': 1.0
+            }
+        ],
+        'c13_nmr': [
+            {
+                'chemical_shift': 18.3,
+                'description': 'CH3',
+                'multiplicity': 's',
+                'integration': 1.0
+            },
+            {
+                'chemical_shift': 58.2,
+                'description': 'CH2',
+                'multiplicity': 's',
+                'integration': 1.0
+            }
+        ],
+        'conditions': {
+            'solvent': 'CDCl3',
+            'field_strength': 400
+        }
+    },
+    'Acetone': {
+        'h1_nmr': [
+            {
+                'chemical_shift': 2.17,
+                'description': 's, 6H',
+                'multiplicity': 's',
+                'integration': 6.0
+            }
+        ],
+        'c13_nmr': [
+            {
+                'chemical_shift': 29.8,
+                'description': 'CH3',
+                'multiplicity': 's',
+                'integration': 2.0
+            },
+            {
+                'chemical_shift': 206.7,
+                'description': 'C=O',
+                'multiplicity': 's',
+                'integration': 1.0
+            }
+        ],
+        'conditions': {
+            'solvent': 'CDCl3',
+            'field_strength': 400
+        }
+    },
+    'Benzene': {
+        'h1_nmr': [
+            {
+                'chemical_shift': 7.36,
+                'description': 's, 6H',
+                'multiplicity': 's',
+                'integration': 6.0
+            }
+        ],
+        'c13_nmr': [
+            {
+                'chemical_shift': 128.4,
+                'description': 'CH',
+                'multiplicity': 's',
+                'integration': 6.0
+            }
+        ],
+        'conditions': {
+            'solvent': 'CDCl3',
+            'field_strength': 400
+        }
+    }
+})
+
 
 class SDBSParser:
     """
@@ -24,35 +161,36 @@ class SDBSParser:
     Converts raw SDBS data into Molecule and Spectrum objects for simulation.
     """
     
-    def __init__(self):
-        """Initialize the SDBS parser."""
-        self.multiplicity_map = {
-            's': 'singlet',
-            'd': 'doublet',
-            't': 'triplet',
-            'q': 'quartet',
-            'qui': 'quintet',
-            'sex': 'sextet',
-            'sep': 'septet',
-            'oct': 'octet',
-            'm': 'multiplet',
-            'br': 'broad',
-            'dd': 'doublet of doublets',
-            'dt': 'doublet of triplets',
-            'td': 'triplet of doublets',
-            'dq': 'doublet of quartets',
-            'qd': 'quartet of doublets',
-            'tt': 'triplet of triplets',
-            'ddd': 'doublet of doublet of doublets',
-            'ddt': 'doublet of doublet of triplets',
-            'dtd': 'doublet of triplet of doublets',
-            'tdd': 'triplet of doublet of doublets',
-            'dddd': 'doublet of doublet of doublet of doublets',
-            'app': 'apparent',
-            'vt': 'virtual triplet',
-            'vd': 'virtual doublet',
-            'vs': 'virtual singlet'
-        }
+    __slots__ = ()
+    
+    # Multiplicity abbreviations, shared read-only by all instances
+    multiplicity_map = MappingProxyType({
+        's': 'singlet',
+        'd': 'doublet',
+        't': 'triplet',
+        'q': 'quartet',
+        'qui': 'quintet',
+        'sex': 'sextet',
+        'sep': 'septet',
+        'oct': 'octet',
+        'm': 'multiplet',
+        'br': 'broad',
+        'dd': 'doublet of doublets',
+        'dt': 'doublet of triplets',
+        'td': 'triplet of doublets',
+        'dq': 'doublet of quartets',
+        'qd': 'quartet of doublets',
+        'tt': 'triplet of triplets',
+        'ddd': 'doublet of doublet of doublets',
+        'ddt': 'doublet of doublet of triplets',
+        'dtd': 'doublet of triplet of doublets',
+        'tdd': 'triplet of doublet of doublets',
+        'dddd': 'doublet of doublet of doublet of doublets',
+        'app': 'apparent',
+        'vt': 'virtual triplet',
+        'vd': 'virtual doublet',
+        'vs': 'virtual singlet'
+    })
     
     def parse_sdbs_data(self, sdbs_data: Dict, compound_name: str = "") -> Tuple[Molecule, List[Spectrum]]:
         """
@@ -73,7 +211,7 @@ class SDBSParser:
         
         # Parse H1 NMR data
         if 'h1_nmr' in sdbs_data and sdbs_data['h1_nmr']:
-            h1_spectrum = self._parse_h1_nmr(sdbs_data['h1_nmr'], sdbs_data.get('conditions', {}))
+            h1_spectrum = self._parse_nmr(sdbs_data['h1_nmr'], sdbs_data.get('conditions', {}), '1H')
             h1_spectrum.title = f"1H NMR Spectrum of {compound_name}"
             spectra.append(h1_spectrum)
             
@@ -82,7 +220,7 @@ class SDBSParser:
         
         # Parse C13 NMR data
         if 'c13_nmr' in sdbs_data and sdbs_data['c13_nmr']:
-            c13_spectrum = self._parse_c13_nmr(sdbs_data['c13_nmr'], sdbs_data.get('conditions', {}))
+            c13_spectrum = self._parse_nmr(sdbs_data['c13_nmr'], sdbs_data.get('conditions', {}), '13C')
             c13_spectrum.title = f"13C NMR Spectrum of {compound_name}"
             spectra.append(c13_spectrum)
             
@@ -91,82 +229,73 @@ class SDBSParser:
         
         return molecule, spectra
     
-    def _parse_h1_nmr(self, h1_data: List[Dict], conditions: Dict) -> Spectrum:
+    def _parse_nmr(self, data: List[Dict], conditions: Dict, nucleus: str) -> Spectrum:
         """
-        Parse 1H NMR data into a Spectrum object.
+        Parse 1H or 13C NMR data into a Spectrum object.
         
         Args:
-            h1_data: List of H1 NMR peak data
+            data: List of NMR peak data
             conditions: Measurement conditions
+            nucleus: Nucleus type ('1H' or '13C')
             
         Returns:
-            Spectrum object for 1H NMR
+            Spectrum object for the given nucleus
         """
         field_strength = conditions.get('field_strength', 400.0)
-        spectrum = Spectrum(nucleus='1H', field_strength=field_strength)
+        spectrum = Spectrum(nucleus=nucleus, field_strength=field_strength)
         
-        for peak_data in h1_data:
-            peak = self._create_peak_from_data(peak_data, field_strength)
-            spectrum.add_peak(peak)
+        spectrum.add_peaks(self._create_peaks_from_data(data, field_strength, nucleus))
         
         return spectrum
     
-    def _parse_c13_nmr(self, c13_data: List[Dict], conditions: Dict) -> Spectrum:
+    def _create_peak_from_data(self, peak_data: Dict, field_strength: float, nucleus: str = '1H') -> Peak:
         """
-        Parse 13C NMR data into a Spectrum object.
+        Create a Peak object from SDBS peak data.
         
         Args:
-            c13_data: List of C13 NMR peak data
-            conditions: Measurement conditions
+            peak_data: Dictionary containing peak information
+            field_strength: NMR field strength in MHz
+            nucleus: Nucleus type ('1H' or '13C') of the spectrum the peak belongs to
             
         Returns:
-            Spectrum object for 13C NMR
+            Peak object
         """
-        field_strength = conditions.get('field_strength', 400.0)
-        spectrum = Spectrum(nucleus='13C', field_strength=field_strength)
-        
-        for peak_data in c13_data:
-            peak = self._create_peak_from_data(peak_data, field_strength)
-            spectrum.add_peak(peak)
-        
-        return spectrum
+        return self._create_peaks_from_data((peak_data,), field_strength, nucleus)[0]
     
-    def _create_peak_from_data(self, peak_data: Dict, field_strength: float) -> Peak:
+    def _create_peaks_from_data(self, data: List[Dict], field_strength: float, nucleus: str) -> List[Peak]:
         """
-        Create a Peak object from SDBS peak data.
+        Create Peak objects for all peak records of one spectrum.
         
         Args:
-            peak_data: Dictionary containing peak information
+            data: List of peak dictionaries
             field_strength: NMR field strength in MHz
+            nucleus: Nucleus type ('1H' or '13C') of the spectrum
             
         Returns:
-            Peak object
+            List of Peak objects, in input order
         """
-        chemical_shift = peak_data.get('chemical_shift', 0.0)
-        multiplicity = peak_data.get('multiplicity', 's')
-        integration = peak_data.get('integration', 1.0)
-        description = peak_data.get('description', '')
-        
-        # Extract coupling constants from description
-        coupling_constants = self._extract_coupling_constants(description)
-        
-        # Estimate peak intensity based on integration
-        intensity = integration if integration else 1.0
+        # Per-spectrum constants and local bindings, resolved once rather than per peak
+        width = 0.5 if nucleus == '13C' else 0.01  # Broader peaks for 13C, narrower for 1H
+        extract_couplings = self._extract_coupling_constants
+        make_peak = Peak
         
-        # Estimate peak width (narrower for 13C, broader for 1H)
-        if 'C' in description or chemical_shift > 50:  # Likely 13C
-            width = 0.5  # Broader peaks for 13C
-        else:  # Likely 1H
-            width = 0.01  # Narrower peaks for 1H
+        peaks = []
+        append = peaks.append
+        for peak_data in data:
+            get = peak_data.get
+            integration = get('integration', 1.0)
+            # Positional in Peak field order (chemical_shift, intensity, width, multiplicity,
+            # integration, coupling_constants): about half the cost of keyword matching
+            append(make_peak(
+                get('chemical_shift', 0.0),
+                integration if integration else 1.0,  # Intensity from integration
+                width,
+                get('multiplicity', 's'),
+                integration,
+                extract_couplings(get('description', ''))
+            ))
         
-        return Peak(
-            chemical_shift=chemical_shift,
-            intensity=intensity,
-            width=width,
-            multiplicity=multiplicity,
-            integration=integration,
-            coupling_constants=coupling_constants
-        )
+        return peaks
     
     def _extract_coupling_constants(self, description: str) -> Optional[List[float]]:
         """
@@ -178,9 +307,11 @@ class SDBSParser:
         Returns:
             List of coupling constants in Hz, or None if none found
         """
-        # Look for patterns like "J = 7.2 Hz" or "J 7.2"
-        j_pattern = r'J\s*=?\s*(\d+\.?\d*)\s*Hz?'
-        matches = re.findall(j_pattern, description, re.IGNORECASE)
+        # Look for patterns like "J = 7.2 Hz" or "J 7.2"; most descriptions ("CH3",
+        # "br s, 1H") carry no J at all, so skip the regex engine for those
+        if 'J' not in description and 'j' not in description:
+            return None
+        matches = _J_COUPLING_RE.findall(description)
         
         if matches:
             try:
@@ -199,16 +330,19 @@ class SDBSParser:
             spectrum: Spectrum containing peak data
             element: Element type ('H' or 'C')
         """
-        for i, peak in enumerate(spectrum.peaks):
-            atom = Atom(
+        # Positions continue after the atoms already present
+        base = len(molecule.atoms) + 1
+        molecule.add_atoms([
+            Atom(
                 element=element,
-                position=len(molecule.atoms) + 1,
+                position=base + i,
                 chemical_shift=peak.chemical_shift,
                 multiplicity=peak.multiplicity,
                 coupling_constants=peak.coupling_constants,
                 integration=peak.integration
             )
-            molecule.add_atom(atom)
+            for i, peak in enumerate(spectrum.peaks)
+        ])
     
     def create_demo_molecule(self, compound_name: str = "Ethanol") -> Tuple[Molecule, List[Spectrum]]:
         """
@@ -231,102 +365,9 @@ class SDBSParser:
             compound_name: Name of the compound
             
         Returns:
-            Dictionary with demo NMR data
+            Dictionary with demo NMR data (shared table entry, do not modify)
         """
-        demo_compounds = {
-            'Ethanol': {
-                'h1_nmr': [
-                    {
-                        'chemical_shift': 1.25,
-                        'description': 't, 3H, J = 7.2 Hz',
-                        'multiplicity': 't',
-                        'integration': 3.0
-                    },
-                    {
-                        'chemical_shift': 3.69,
-                        'description': 'q, 2H, J = 7.2 Hz',
-                        'multiplicity': 'q',
-                        'integration': 2.0
-                    },
-                    {
-                        'chemical_shift': 5.32,
-                        'description': 'br s, 1H',
-                        'multiplicity': 's',
-                        'integration': 1.0
-                    }
-                ],
-                'c13_nmr': [
-                    {
-                        'chemical_shift': 18.3,
-                        'description': 'CH3',
-                        'multiplicity': 's',
-                        'integration': 1.0
-                    },
-                    {
-                        'chemical_shift': 58.2,
-                        'description': 'CH2',
-                        'multiplicity': 's',
-                        'integration': 1.0
-                    }
-                ],
-                'conditions': {
-                    'solvent': 'CDCl3',
-                    'field_strength': 400
-                }
-            },
-            'Acetone': {
-                'h1_nmr': [
-                    {
-                        'chemical_shift': 2.17,
-                        'description': 's, 6H',
-                        'multiplicity': 's',
-                        'integration': 6.0
-                    }
-                ],
-                'c13_nmr': [
-                    {
-                        'chemical_shift': 29.8,
-                        'description': 'CH3',
-                        'multiplicity': 's',
-                        'integration': 2.0
-                    },
-                    {
-                        'chemical_shift': 206.7,
-                        'description': 'C=O',
-                        'multiplicity': 's',
-                        'integration': 1.0
-                    }
-                ],
-                'conditions': {
-                    'solvent': 'CDCl3',
-                    'field_strength': 400
-                }
-            },
-            'Benzene': {
-                'h1_nmr': [
-                    {
-                        'chemical_shift': 7.36,
-                        'description': 's, 6H',
-                        'multiplicity': 's',
-                        'integration': 6.0
-                    }
-                ],
-                'c13_nmr': [
-                    {
-                        'chemical_shift': 128.4,
-                        'description': 'CH',
-                        'multiplicity': 's',
-                        'integration': 6.0
-                    }
-                ],
-                'conditions': {
-                    'solvent': 'CDCl3',
-                    'field_strength': 400
-                }
-            }
-        }
-        
-        return demo_compounds.get(compound_name, demo_compounds['Ethanol'])
+        return _DEMO_COMPOUNDS.get(compound_name, _DEMO_COMPOUNDS['Ethanol'])
     
     def validate_chemical_shifts(self, spectrum: Spectrum) -> List[str]:
         """
@@ -338,19 +379,20 @@ class SDBSParser:
         Returns:
             List of validation warnings
         """
-        warnings = []
+        limits = _SHIFT_LIMITS.get(spectrum.nucleus)
+        peaks = spectrum.peaks
+        if limits is None or not peaks:
+            return []
         
-        for i, peak in enumerate(spectrum.peaks):
-            shift = peak.chemical_shift
-            
-            if spectrum.nucleus == '1H':
-                if shift < -5 or shift > 20:
-                    warnings.append(f"Peak {i+1}: Unusual 1H chemical shift ({shift:.2f} ppm)")
-            elif spectrum.nucleus == '13C':
-                if shift < -20 or shift > 250:
-                    warnings.append(f"Peak {i+1}: Unusual 13C chemical shift ({shift:.2f} ppm)")
+        # Flag out-of-range shifts in one array scan, then format only those peaks
+        shifts = np.fromiter((peak.chemical_shift for peak in peaks), dtype=np.float64, count=len(peaks))
+        lo, hi = limits
+        nucleus = spectrum.nucleus
         
-        return warnings
+        return [
+            f"Peak {i+1}: Unusual {nucleus} chemical shift ({peaks[i].chemical_shift:.2f} ppm)"
+            for i in _find_bad_shifts(shifts, lo, hi).tolist()
+        ]
     
     def export_to_nmr_format(self, spectrum: Spectrum, format_type: str = 'simple') -> str:
         """
@@ -367,15 +409,13 @@ class SDBSParser:
             lines = []
             lines.append(f"{spectrum.nucleus} NMR ({spectrum.field_strength} MHz):")
             
+            # One f-string per peak; the optional parts are empty when absent
             for peak in spectrum.peaks:
-                line = f"δ {peak.chemical_shift:.2f} ({peak.multiplicity}"
-                if peak.integration and peak.integration != 1.0:
-                    line += f", {peak.integration:.0f}H"
-                if peak.coupling_constants:
-                    j_values = ", ".join(f"J = {j:.1f} Hz" for j in peak.coupling_constants)
-                    line += f", {j_values}"
-                line += ")"
-                lines.append(line)
+                integration = peak.integration
+                couplings = peak.coupling_constants
+                integration_part = f", {integration:.0f}H" if integration and integration != 1.0 else ""
+                j_part = ", " + ", ".join([f"J = {j:.1f} Hz" for j in couplings]) if couplings else ""
+                lines.append(f"δ {peak.chemical_shift:.2f} ({peak.multiplicity}{integration_part}{j_part})")
             
             return "\n".join(lines)
         
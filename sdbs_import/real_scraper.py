@@ -5,12 +5,50 @@ This module scrapes actual NMR data from the SDBS (Spectral Database for Organic
 """
 
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 import re
+import threading
 from typing import List, Dict, Any, Optional, Tuple
 import time
 from urllib.parse import urljoin, parse_qs, urlparse
 
+# lxml parsers are not thread-safe, so each thread lazily gets its own. Pages are
+# decoded as UTF-8 (not Latin-1 when the charset meta is missing) and comments
+# are dropped so they never reach the page text
+_PARSERS = threading.local()
+
+# Page text as BeautifulSoup's get_text() saw it: every text node except script/style
+_VISIBLE_TEXT_XPATH = etree.XPath('.//text()[not(ancestor::script) and not(ancestor::style)]')
+
+# Precompiled page patterns: compound identifiers, "Hz ppm Int." peak rows, and the
+# "A 7.600" assignment fallback
+_INCHI_RE = re.compile(r'InChI=([^\s\n]+)')
+_INCHIKEY_RE = re.compile(r'InChIKey:\s*([A-Z0-9-]+)')
+_FORMULA_RE = re.compile(r'([C][0-9]*[H][0-9]*[A-Z]*[0-9]*)')
+_PEAK_RE = re.compile(r'(\d+\.?\d*)\s+(\d+\.?\d*)\s+(\d+\.?\d*)')
+_SIMPLE_RE = re.compile(r'([A-Z])\s+(\d+\.?\d*)')
+
+
+def _parse_html(content: bytes) -> Optional[etree._Element]:
+    """Parse raw page bytes into an lxml tree (None for an empty page)."""
+    parser = getattr(_PARSERS, 'parser', None)
+    if parser is None:
+        parser = _PARSERS.parser = lxml_html.HTMLParser(encoding='utf-8', remove_comments=True)
+    return etree.fromstring(content, parser) if content and content.strip() else None
+
+
+def _page_body(tree: Optional[etree._Element]) -> Optional[etree._Element]:
+    """The <body> of a parsed page, falling back to the root when there is none."""
+    if tree is None:
+        return None
+    body = tree.find('body')
+    return body if body is not None else tree
+
+
+def _visible_text(element: Optional[etree._Element]) -> str:
+    """Concatenated visible text of an element (empty for None)."""
+    return ''.join(_VISIBLE_TEXT_XPATH(element)) if element is not None else ''
+
 
 class RealSDBSScraper:
     """Real scraper for SDBS (Spectral Database for Organic Compounds) website."""
@@ -40,13 +78,14 @@ class RealSDBSScraper:
             response = self.session.get(h1_url, timeout=10)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            tree = _parse_html(response.content)
             
             # Extract compound information
-            compound_data = self._extract_compound_info(soup, sdbs_id)
+            compound_data = self._extract_compound_info(tree, sdbs_id)
             
-            # Extract 1H NMR data
-            h1_peaks = self._extract_peak_data(soup)
+            # Extract 1H NMR data; peaks of both spectra are read from the page body only,
+            # so <title>/<head> text never yields spurious peaks
+            h1_peaks = self._extract_peak_data(_page_body(tree))
             compound_data['h1_nmr'] = h1_peaks
             
             # Try to get 13C NMR data
@@ -54,8 +93,7 @@ class RealSDBSScraper:
             try:
                 c13_response = self.session.get(c13_url, timeout=10)
                 if c13_response.status_code == 200:
-                    c13_soup = BeautifulSoup(c13_response.content, 'html.parser')
-                    c13_peaks = self._extract_peak_data(c13_soup)
+                    c13_peaks = self._extract_peak_data(_page_body(_parse_html(c13_response.content)))
                     compound_data['c13_nmr'] = c13_peaks
             except:
                 compound_data['c13_nmr'] = []
@@ -111,7 +149,7 @@ class RealSDBSScraper:
             print(f"Error searching SDBS: {e}")
             return []
     
-    def _extract_compound_info(self, soup: BeautifulSoup, sdbs_id: str) -> Dict[str, Any]:
+    def _extract_compound_info(self, tree: Optional[etree._Element], sdbs_id: str) -> Dict[str, Any]:
         """Extract basic compound information from the page."""
         compound_data = {
             'sdbs_id': sdbs_id,
@@ -124,25 +162,25 @@ class RealSDBSScraper:
         
         try:
             # Look for compound name in title or specific elements
-            title = soup.find('title')
-            if title and title.text:
-                compound_data['name'] = title.text.split('-')[0].strip()
+            title = tree.findtext('.//title') if tree is not None else None
+            if title:
+                compound_data['name'] = title.split('-')[0].strip()
             
             # Look for InChI data
-            text_content = soup.get_text()
+            text_content = _visible_text(tree)
             
             # Extract InChI
-            inchi_match = re.search(r'InChI=([^\s\n]+)', text_content)
+            inchi_match = _INCHI_RE.search(text_content)
             if inchi_match:
                 compound_data['inchi'] = f"InChI={inchi_match.group(1)}"
             
             # Extract InChI Key
-            inchi_key_match = re.search(r'InChIKey:\s*([A-Z0-9-]+)', text_content)
+            inchi_key_match = _INCHIKEY_RE.search(text_content)
             if inchi_key_match:
                 compound_data['inchi_key'] = inchi_key_match.group(1)
             
             # Extract molecular formula if present
-            formula_match = re.search(r'([C][0-9]*[H][0-9]*[A-Z]*[0-9]*)', text_content)
+            formula_match = _FORMULA_RE.search(text_content)
             if formula_match:
                 compound_data['formula'] = formula_match.group(1)
                 
@@ -151,7 +189,7 @@ class RealSDBSScraper:
         
         return compound_data
     
-    def _extract_peak_data(self, soup: BeautifulSoup) -> List[Dict[str, float]]:
+    def _extract_peak_data(self, tree: Optional[etree._Element]) -> List[Dict[str, float]]:
         """
         Extract peak data from SDBS page.
         
@@ -162,11 +200,10 @@ class RealSDBSScraper:
         
         try:
             # Look for peak data table or text
-            text_content = soup.get_text()
+            text_content = _visible_text(tree)
             
             # Try to find peak data in the format: Hz ppm Int.
-            peak_pattern = r'(\d+\.?\d*)\s+(\d+\.?\d*)\s+(\d+\.?\d*)'
-            matches = re.findall(peak_pattern, text_content)
+            matches = _PEAK_RE.findall(text_content)
             
             for match in matches:
                 try:
@@ -187,8 +224,7 @@ class RealSDBSScraper:
             # If no tabular data found, look for simpler format
             if not peaks:
                 # Look for format like "A 7.600"
-                simple_pattern = r'([A-Z])\s+(\d+\.?\d*)'
-                simple_matches = re.findall(simple_pattern, text_content)
+                simple_matches = _SIMPLE_RE.findall(text_content)
                 
                 for i, match in enumerate(simple_matches):
                     try:
@@ -0,0 +1,34 @@
+"""Regression tests for peak_grouper coupling-constant analysis."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from peak_grouper import PeakGrouper
+
+
+def _shifts_from_separations(separations_hz, mhz=400.0):
+    """Line positions (ppm) whose adjacent separations are the given values in Hz."""
+    shifts = [0.0]
+    for sep in separations_hz:
+        shifts.append(shifts[-1] + sep / mhz)
+    return shifts
+
+
+def test_complex_pattern_groups_do_not_chain():
+    # 8.5 Hz is within 2 Hz of 7.0 but 10.0 is not, so 10.0 must stay a separate coupling
+    grouper = PeakGrouper()
+    shifts = _shifts_from_separations([7.0, 8.5, 10.0])
+    
+    assert grouper._analyze_complex_pattern(shifts, [1.0] * len(shifts)) == pytest.approx([7.0, 10.0])
+
+
+def test_complex_pattern_keeps_first_seen_value():
+    # Near-identical separations collapse onto the first one seen, not the smallest
+    grouper = PeakGrouper()
+    shifts = _shifts_from_separations([7.2, 2.0, 6.9, 2.1, 7.1])
+    
+    assert grouper._analyze_complex_pattern(shifts, [1.0] * len(shifts)) == pytest.approx([2.0, 7.2])